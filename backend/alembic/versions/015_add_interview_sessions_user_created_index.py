@@ -0,0 +1,28 @@
+"""add interview_sessions (user_id, created_at) index
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Supports the per-user, time-windowed leaderboard aggregate
+    op.create_index(
+        'idx_interview_sessions_user_created',
+        'interview_sessions',
+        ['user_id', 'created_at']
+    )
+
+
+def downgrade():
+    op.drop_index('idx_interview_sessions_user_created', table_name='interview_sessions')
@@ -0,0 +1,28 @@
+"""add interview_sessions (user_id, status) index
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Supports the per-role cohort scan of completed sessions
+    op.create_index(
+        'idx_interview_sessions_user_status',
+        'interview_sessions',
+        ['user_id', 'status']
+    )
+
+
+def downgrade():
+    op.drop_index('idx_interview_sessions_user_status', table_name='interview_sessions')
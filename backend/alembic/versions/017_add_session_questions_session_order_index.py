@@ -0,0 +1,28 @@
+"""add session_questions (session_id, display_order) index
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Supports looking up a session's question by its display number
+    op.create_index(
+        'idx_session_questions_session_order',
+        'session_questions',
+        ['session_id', 'display_order']
+    )
+
+
+def downgrade():
+    op.drop_index('idx_session_questions_session_order', table_name='session_questions')
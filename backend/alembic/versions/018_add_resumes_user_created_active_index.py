@@ -0,0 +1,30 @@
+"""add partial resumes (user_id, created_at) index for live resumes
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Supports listing a user's non-deleted resumes newest first
+    op.create_index(
+        'idx_resumes_user_created_active',
+        'resumes',
+        ['user_id', 'created_at'],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('idx_resumes_user_created_active', table_name='resumes')
@@ -27,11 +27,14 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_VERIFY_CACHE_TTL: int = 30  # Seconds to reuse a verified token payload (0 disables)
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)  # bcrypt cost factor (log2 of iterations)
     
     # Database
     DATABASE_URL: str = Field(..., description="PostgreSQL connection string")
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_RECYCLE: int = 3600  # Seconds before a pooled connection is replaced (-1 disables)
     
     # Redis
     REDIS_HOST: str = "localhost"
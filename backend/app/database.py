@@ -11,6 +11,7 @@ engine = create_engine(
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,  # Verify connections before using
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,  # Replace long-lived connections
     echo=settings.DEBUG  # Log SQL queries in debug mode
 )
 
@@ -3,13 +3,16 @@ FastAPI Application Entry Point
 """
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from loguru import logger
 from contextlib import asynccontextmanager
+import functools
+import itertools
+import json
+import os
 import time
-import uuid
 
 from app.config import settings
 from app.logging_config import setup_logging
@@ -60,13 +63,19 @@ app.add_middleware(
 )
 
 
+# Request IDs are a random per-process prefix plus a counter, so each
+# request costs one integer increment instead of a urandom read
+_REQUEST_ID_PREFIX = os.urandom(6).hex()
+_request_counter = itertools.count(1)
+
+
 # Request ID Middleware
 @app.middleware("http")
 async def add_request_id(request: Request, call_next):
     """
     Add unique request ID to each request for tracing.
     """
-    request_id = str(uuid.uuid4())
+    request_id = f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
     request.state.request_id = request_id
     
     # Process request
@@ -156,6 +165,31 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _health_body(db_status: str, cache_status: str) -> bytes:
+    """
+    Serialized /health payload for a given database/cache status.
+    
+    Only the two status fields vary, so each combination is encoded once
+    and reused instead of being re-serialized on every probe.
+    """
+    return json.dumps({
+        "status": "healthy",
+        "version": settings.APP_VERSION,
+        "environment": settings.ENVIRONMENT,
+        "database": db_status,
+        "cache": cache_status,
+    }).encode()
+
+
+# Root payload only depends on settings, so encode it once at import
+_ROOT_BODY = json.dumps({
+    "name": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
+}).encode()
+
+
 # Health Check Endpoint
 @app.get("/health")
 async def health_check(db: Session = Depends(get_db)):
@@ -174,13 +208,7 @@ async def health_check(db: Session = Depends(get_db)):
     # Test cache connection
     cache_status = "connected" if cache_service.is_available() else "unavailable"
     
-    return {
-        "status": "healthy",
-        "version": settings.APP_VERSION,
-        "environment": settings.ENVIRONMENT,
-        "database": db_status,
-        "cache": cache_status,
-    }
+    return Response(content=_health_body(db_status, cache_status), media_type="application/json")
 
 
 # Cache Metrics Endpoint
@@ -198,11 +226,7 @@ async def root():
     """
     Root endpoint with API information.
     """
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "docs": "/docs" if settings.DEBUG else "Documentation disabled in production",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # Import and include routers
@@ -5,7 +5,7 @@ This model represents an interview practice session with questions and answers.
 
 Requirements: 14.1-14.10, 15.1-15.7, 16.1-16.10, 19.1-19.12
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -54,6 +54,12 @@ class InterviewSession(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     deleted_at = Column(DateTime, nullable=True)
     
+    # Indexes for efficient querying
+    __table_args__ = (
+        Index('idx_interview_sessions_user_created', 'user_id', 'created_at'),  # Leaderboard windows
+        Index('idx_interview_sessions_user_status', 'user_id', 'status'),  # Cohort completed sessions
+    )
+    
     def __repr__(self):
         return f"<InterviewSession(id={self.id}, user_id={self.user_id}, role='{self.role}', status='{self.status}')>"
     
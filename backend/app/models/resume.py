@@ -1,7 +1,7 @@
 """
 Resume model for storing user resumes with NLP-extracted data
 """
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Index, text, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
@@ -86,6 +86,17 @@ class Resume(BaseModel):
     user = relationship("User", back_populates="resumes")
     analyses = relationship("ResumeAnalysis", back_populates="resume", cascade="all, delete-orphan")
     
+    # Indexes for efficient querying
+    __table_args__ = (
+        # A user's live resumes, newest first
+        Index(
+            'idx_resumes_user_created_active',
+            'user_id',
+            'created_at',
+            postgresql_where=text('deleted_at IS NULL')
+        ),
+    )
+    
     def __repr__(self):
         return f"<Resume(id={self.id}, user_id={self.user_id}, filename={self.filename}, status={self.status})>"
     
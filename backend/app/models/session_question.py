@@ -5,7 +5,7 @@ This model links questions to interview sessions with display order and timing.
 
 Requirements: 14.8, 14.9, 15.1-15.7
 """
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, String
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, String, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -42,6 +42,11 @@ class SessionQuestion(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     deleted_at = Column(DateTime, nullable=True)
     
+    # Indexes for efficient querying
+    __table_args__ = (
+        Index('idx_session_questions_session_order', 'session_id', 'display_order'),  # Question by number
+    )
+    
     def __repr__(self):
         return f"<SessionQuestion(id={self.id}, session_id={self.session_id}, question_id={self.question_id}, order={self.display_order})>"
     
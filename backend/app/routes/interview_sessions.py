@@ -196,42 +196,41 @@ async def get_question(
         
         logger.info(f"Retrieving question {question_number} for session {session_id}, user {user_id}")
         
-        # Create service
-        service = InterviewSessionService(db)
-        
-        # Get session and validate ownership (Req 15.1)
-        session = service.get_session(session_id, user_id)
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Session not found or access denied"
-            )
-        
-        # Get question by display order (Req 15.2)
+        # Get question by display order (Req 15.2) together with the
+        # question and the ownership check (Req 15.1) in a single query
+        from sqlalchemy.orm import contains_eager
+        from app.models.interview_session import InterviewSession
         from app.models.session_question import SessionQuestion
         from app.models.question import Question
         
-        session_question = db.query(SessionQuestion).join(Question).filter(
+        session_question = db.query(SessionQuestion).join(Question).join(
+            InterviewSession, InterviewSession.id == SessionQuestion.session_id
+        ).options(
+            contains_eager(SessionQuestion.question)
+        ).filter(
             SessionQuestion.session_id == session_id,
-            SessionQuestion.display_order == question_number
+            SessionQuestion.display_order == question_number,
+            InterviewSession.user_id == user_id,
+            InterviewSession.deleted_at.is_(None)
         ).first()
         
         if not session_question:
+            # Only the miss path needs to tell the two 404s apart
+            if not InterviewSessionService(db).owns_session(session_id, user_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Session not found or access denied"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Question {question_number} not found in session"
             )
         
-        # Record question displayed timestamp (Req 15.4)
-        from datetime import datetime
-        if not session_question.question_displayed_at:
-            session_question.question_displayed_at = datetime.utcnow()
-            db.commit()
-        
         # Get question details
         question = session_question.question
         
-        # Format response (Req 15.3)
+        # Format response (Req 15.3) before the commit below expires the
+        # loaded rows, so it needs no further queries
         response = QuestionResponse(
             id=question.id,
             question_text=question.question_text,
@@ -241,6 +240,20 @@ async def get_question(
             question_number=question_number
         )
         
+        # Record question displayed timestamp (Req 15.4). The conditional
+        # UPDATE keeps the first view's timestamp even when duplicate
+        # requests race, and repeat views skip the write entirely.
+        from datetime import datetime
+        from sqlalchemy import update
+        if not session_question.question_displayed_at:
+            db.execute(
+                update(SessionQuestion).where(
+                    SessionQuestion.id == session_question.id,
+                    SessionQuestion.question_displayed_at.is_(None)
+                ).values(question_displayed_at=datetime.utcnow())
+            )
+            db.commit()
+        
         logger.info(f"Successfully retrieved question {question_number} for session {session_id}")
         return response
         
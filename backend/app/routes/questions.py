@@ -63,15 +63,9 @@ async def generate_questions(
         # Initialize service
         service = QuestionService(db)
         
-        # Check if response will be from cache (for cache_hit flag)
-        cache_key = service._construct_cache_key(
-            request.role,
-            request.difficulty,
-            request.question_count,
-            request.categories
-        )
-        cached_data = service._get_from_cache(cache_key)
-        cache_hit = cached_data is not None
+        # generate() always asks the AI for fresh questions and never reads
+        # the question cache, so there is no cache lookup to report on
+        cache_hit = False
         
         # Generate questions
         questions_data = service.generate(
@@ -3,6 +3,7 @@ Quota Tracker for AI Provider Usage Management
 """
 from datetime import date, datetime
 from typing import Dict, Optional
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 import logging
 from app.models.ai_provider_usage import AIProviderUsage
@@ -29,23 +30,28 @@ class QuotaTracker:
         if request_count < 0:
             raise ValueError(f"request_count must be non-negative, got {request_count}")
         today = date.today()
+        now = datetime.utcnow()
+        # Single atomic upsert on the (provider_name, date) unique constraint
+        stmt = insert(AIProviderUsage).values(
+            provider_name=provider_name,
+            date=today,
+            request_count=request_count,
+            character_count=character_count,
+            created_at=now,
+            updated_at=now
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint='uix_provider_date',
+            set_={
+                'request_count': AIProviderUsage.request_count + stmt.excluded.request_count,
+                'character_count': AIProviderUsage.character_count + stmt.excluded.character_count,
+                'updated_at': stmt.excluded.updated_at
+            }
+        ).returning(AIProviderUsage)
         try:
-            usage = self.db.query(AIProviderUsage).filter(
-                AIProviderUsage.provider_name == provider_name,
-                AIProviderUsage.date == today
-            ).first()
-            if usage:
-                usage.request_count += request_count
-                usage.character_count += character_count
-                usage.updated_at = datetime.utcnow()
-            else:
-                usage = AIProviderUsage(
-                    provider_name=provider_name,
-                    date=today,
-                    request_count=request_count,
-                    character_count=character_count
-                )
-                self.db.add(usage)
+            usage = self.db.scalars(
+                stmt, execution_options={'populate_existing': True}
+            ).one()
             self.db.commit()
             logger.info(f"Recorded usage for {provider_name}")
             self._check_and_alert(provider_name, usage)
@@ -70,11 +76,14 @@ class QuotaTracker:
     
     def get_usage_stats(self, provider_name: str) -> Dict:
         today = date.today()
-        quota_limit = PROVIDER_QUOTAS.get(provider_name, 0)
         usage = self.db.query(AIProviderUsage).filter(
             AIProviderUsage.provider_name == provider_name,
             AIProviderUsage.date == today
         ).first()
+        return self._build_usage_stats(provider_name, today, usage)
+    
+    def _build_usage_stats(self, provider_name: str, today: date, usage: Optional[AIProviderUsage]) -> Dict:
+        quota_limit = PROVIDER_QUOTAS.get(provider_name, 0)
         if not usage:
             return {
                 'provider_name': provider_name,
@@ -85,7 +94,8 @@ class QuotaTracker:
                 'remaining_percentage': 1.0,
                 'status': 'available'
             }
-        remaining_pct = self.get_remaining_percentage(provider_name)
+        # Same calculation as get_remaining_percentage, on the row already loaded
+        remaining_pct = max(0.0, 1.0 - usage.character_count / quota_limit) if quota_limit else 1.0
         if remaining_pct <= 0:
             status = 'disabled'
         elif remaining_pct <= 0.10:
@@ -108,7 +118,11 @@ class QuotaTracker:
         return self.get_remaining_percentage(provider_name) > 0.0
     
     def _check_and_alert(self, provider_name: str, usage: AIProviderUsage) -> None:
-        remaining_pct = self.get_remaining_percentage(provider_name)
+        # Use the freshly upserted row rather than re-querying it
+        quota_limit = PROVIDER_QUOTAS.get(provider_name)
+        if not quota_limit:
+            return
+        remaining_pct = max(0.0, 1.0 - usage.character_count / quota_limit)
         if remaining_pct <= 0.0:
             logger.error(f"QUOTA EXCEEDED: {provider_name}")
         elif remaining_pct <= 0.10:
@@ -117,10 +131,19 @@ class QuotaTracker:
             logger.warning(f"WARNING: {provider_name} at 80%")
     
     def get_all_provider_stats(self) -> Dict[str, Dict]:
-        stats = {}
-        for provider_name in PROVIDER_QUOTAS.keys():
-            stats[provider_name] = self.get_usage_stats(provider_name)
-        return stats
+        # Load today's rows for every provider in one query
+        today = date.today()
+        usages = {
+            usage.provider_name: usage
+            for usage in self.db.query(AIProviderUsage).filter(
+                AIProviderUsage.provider_name.in_(PROVIDER_QUOTAS.keys()),
+                AIProviderUsage.date == today
+            )
+        }
+        return {
+            provider_name: self._build_usage_stats(provider_name, today, usages.get(provider_name))
+            for provider_name in PROVIDER_QUOTAS
+        }
     
     def reset_daily_usage(self, provider_name: Optional[str] = None) -> None:
         today = date.today()
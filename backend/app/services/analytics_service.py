@@ -5,6 +5,8 @@ from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, desc
+import bisect
+import heapq
 import logging
 
 from app.models.interview_session import InterviewSession
@@ -25,6 +27,7 @@ from app.schemas.performance_comparison import (
 )
 from app.models.user import User
 from app.services.cache_service import CacheService
+from app.utils.cache_keys import CacheKeys, CacheTTL
 
 logger = logging.getLogger(__name__)
 
@@ -458,7 +461,8 @@ class AnalyticsService:
         cohort_scores = [score for _, score in cohort]
         user_percentile = self._calculate_percentile(user_avg_score, cohort_scores)
         
-        # Calculate cohort stats (Requirement 21.4)
+        # Calculate cohort stats (Requirement 21.4). Derived from the same
+        # cached cohort as the percentile, so both describe one snapshot.
         cohort_stats = self._get_cohort_stats(user.target_role, cohort)
         
         # Get top performer habits (Requirements 21.5, 21.6, 21.7)
@@ -502,25 +506,43 @@ class AnalyticsService:
         
         Returns list of (user_id, avg_score) tuples.
         Requirement 21.2
+        
+        The cohort is shared by every user with the same target role, so it
+        is cached per role for ``CacheTTL.L3_ANALYTICS_COHORT`` instead of
+        re-aggregating all evaluations for each user's comparison.
         """
-        # Get all users with same target role who have completed sessions
-        users_with_scores = self.db.query(
-            User.id,
-            func.avg(Evaluation.overall_score).label('avg_score')
-        ).join(
-            InterviewSession, InterviewSession.user_id == User.id
+        cache_key = CacheKeys.analytics_cohort(target_role)
+        cached_cohort = self.cache.get(cache_key)
+        if cached_cohort is not None:
+            return [(user_id, score) for user_id, score in cached_cohort]
+        
+        # Narrow to the cohort's completed sessions first, so the answer and
+        # evaluation joins and the aggregate only touch this role's rows
+        cohort_sessions = self.db.query(
+            InterviewSession.id,
+            InterviewSession.user_id
         ).join(
-            Answer, Answer.session_id == InterviewSession.id
-        ).join(
-            Evaluation, Evaluation.answer_id == Answer.id
+            User, User.id == InterviewSession.user_id
         ).filter(
             and_(
                 User.target_role == target_role,
                 InterviewSession.status == 'completed'
             )
-        ).group_by(User.id).all()
+        ).subquery()
         
-        return [(user_id, float(avg_score)) for user_id, avg_score in users_with_scores]
+        users_with_scores = self.db.query(
+            cohort_sessions.c.user_id,
+            func.avg(Evaluation.overall_score).label('avg_score')
+        ).join(
+            Answer, Answer.session_id == cohort_sessions.c.id
+        ).join(
+            Evaluation, Evaluation.answer_id == Answer.id
+        ).group_by(cohort_sessions.c.user_id).order_by('avg_score').all()
+        
+        # Ascending by score, so percentiles can be found by binary search
+        cohort = [(user_id, float(avg_score)) for user_id, avg_score in users_with_scores]
+        self.cache.set(cache_key, cohort, ttl=CacheTTL.L3_ANALYTICS_COHORT)
+        return cohort
     
     def _calculate_percentile(self, user_score: float, cohort_scores: List[float]) -> float:
         """
@@ -528,8 +550,11 @@ class AnalyticsService:
         
         Percentile = (number of scores below user) / (total scores) * 100
         Requirement 21.3
+        
+        ``cohort_scores`` must be sorted ascending (as returned by
+        ``_get_user_cohort``); the count below is a binary search.
         """
-        scores_below = sum(1 for score in cohort_scores if score < user_score)
+        scores_below = bisect.bisect_left(cohort_scores, user_score)
         percentile = (scores_below / len(cohort_scores)) * 100
         return round(percentile, 2)
     
@@ -539,26 +564,26 @@ class AnalyticsService:
         
         Requirement 21.4
         """
-        scores = [score for _, score in cohort]
+        # Cohorts from _get_user_cohort are already ascending, which makes
+        # this sort a linear pass
+        sorted_scores = sorted(score for _, score in cohort)
         
         # Calculate average
-        cohort_average = sum(scores) / len(scores)
+        cohort_average = sum(sorted_scores) / len(sorted_scores)
         
         # Calculate median
-        sorted_scores = sorted(scores)
         mid = len(sorted_scores) // 2
         if len(sorted_scores) % 2 == 0:
             cohort_median = (sorted_scores[mid - 1] + sorted_scores[mid]) / 2
         else:
             cohort_median = sorted_scores[mid]
         
-        # Calculate score distribution
+        # Calculate score distribution: bucket edges are found by binary
+        # search in the sorted scores instead of one scan per bucket
+        edges = [0] + [bisect.bisect_left(sorted_scores, bound) for bound in (60, 70, 80, 90)] + [len(sorted_scores)]
         score_distribution = {
-            "0-60": sum(1 for s in scores if s < 60),
-            "60-70": sum(1 for s in scores if 60 <= s < 70),
-            "70-80": sum(1 for s in scores if 70 <= s < 80),
-            "80-90": sum(1 for s in scores if 80 <= s < 90),
-            "90-100": sum(1 for s in scores if s >= 90)
+            label: edges[i + 1] - edges[i]
+            for i, label in enumerate(("0-60", "60-70", "70-80", "80-90", "90-100"))
         }
         
         return CohortStats(
@@ -575,10 +600,11 @@ class AnalyticsService:
         
         Requirements 21.5, 21.6, 21.7
         """
-        # Identify top 10% (90th percentile and above)
-        sorted_cohort = sorted(cohort, key=lambda x: x[1], reverse=True)
-        top_10_percent_count = max(1, len(sorted_cohort) // 10)
-        top_performers = [user_id for user_id, _ in sorted_cohort[:top_10_percent_count]]
+        # Identify top 10% (90th percentile and above); only those users need
+        # ordering, so select them with a bounded heap instead of a full sort
+        top_10_percent_count = max(1, len(cohort) // 10)
+        top_cohort = heapq.nlargest(top_10_percent_count, cohort, key=lambda x: x[1])
+        top_performers = [user_id for user_id, _ in top_cohort]
         
         if not top_performers:
             # Return default values if no top performers
@@ -8,6 +8,7 @@ Requirements: 14.1-14.10
 import json
 import logging
 from typing import Dict, List, Optional
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
@@ -156,6 +157,27 @@ class InterviewSessionService:
         
         return session
     
+    def owns_session(self, session_id: int, user_id: int) -> bool:
+        """
+        Check that a non-deleted session exists and belongs to the user.
+        
+        Cheaper than ``get_session`` when the row itself is not needed.
+        
+        Args:
+            session_id: Session ID
+            user_id: User ID (for authorization)
+            
+        Returns:
+            True if the user owns the session
+        """
+        return self.db.query(
+            exists().where(
+                InterviewSession.id == session_id,
+                InterviewSession.user_id == user_id,
+                InterviewSession.deleted_at.is_(None)
+            )
+        ).scalar()
+    
     def _cache_session_metadata(self, session_id: int, metadata: Dict) -> None:
         """
         Cache session metadata in Redis with 2-hour TTL.
@@ -10,8 +10,8 @@ from app.models.leaderboard_entry import LeaderboardEntry
 from app.models.user import User
 from app.models.interview_session import InterviewSession
 from app.models.session_summary import SessionSummary
-from app.services.cache_service import CacheService
-from app.utils.cache_keys import CacheKeys
+from app.services.cache_service import CacheService, cache_service as shared_cache_service
+from app.utils.cache_keys import CacheKeys, CacheTTL
 import random
 import logging
 
@@ -21,9 +21,10 @@ logger = logging.getLogger(__name__)
 class LeaderboardService:
     """Service for managing leaderboards."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache_service: Optional[CacheService] = None):
         self.db = db
-        self.cache_service = CacheService()
+        # Reuse the process-wide Redis pool instead of opening one per request
+        self.cache_service = cache_service or shared_cache_service
     
     def calculate_leaderboard(self, period: str = 'weekly') -> List[LeaderboardEntry]:
         """
@@ -47,11 +48,13 @@ class LeaderboardService:
             else:  # all_time (Req 24.7)
                 date_filter = True
             
-            # Query user performance (Req 24.3)
+            # Query user performance and rank in a single aggregate (Req 24.3)
+            average_score = func.avg(SessionSummary.overall_session_score)
             query = self.db.query(
                 InterviewSession.user_id,
-                func.avg(SessionSummary.overall_session_score).label('average_score'),
-                func.count(InterviewSession.id).label('total_interviews')
+                average_score.label('average_score'),
+                func.count(InterviewSession.id).label('total_interviews'),
+                func.row_number().over(order_by=average_score.desc()).label('rank')
             ).join(
                 SessionSummary, InterviewSession.id == SessionSummary.session_id
             ).join(
@@ -78,27 +81,23 @@ class LeaderboardService:
                 LeaderboardEntry.period == period
             ).delete()
             
-            # Create leaderboard entries
-            entries = []
+            # Create leaderboard entries (Req 24.5, 24.6)
             calculated_at = datetime.utcnow()
-            
-            for rank, result in enumerate(results, start=1):
-                # Anonymize username (Req 24.5)
-                anonymous_username = self._generate_anonymous_username()
-                
-                # Create entry (Req 24.6)
-                entry = LeaderboardEntry(
+            usernames = self._generate_anonymous_usernames(len(results))
+            entries = [
+                LeaderboardEntry(
                     period=period,
-                    rank=rank,
-                    anonymous_username=anonymous_username,
+                    rank=result.rank,
+                    anonymous_username=username,
                     average_score=round(float(result.average_score), 2),
                     total_interviews=result.total_interviews,
                     calculated_at=calculated_at
                 )
-                
-                self.db.add(entry)
-                entries.append(entry)
+                for result, username in zip(results, usernames)
+            ]
             
+            # Single batched INSERT for all entries
+            self.db.add_all(entries)
             self.db.commit()
             
             # Cache results (Req 24.8)
@@ -132,7 +131,7 @@ class LeaderboardService:
         cache_key = CacheKeys.leaderboard(period)
         cached_data = self.cache_service.get(cache_key)
         
-        if cached_data:
+        if cached_data is not None:
             elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
             logger.info(f"Leaderboard retrieved from cache for {period} in {elapsed:.2f}ms")
             return cached_data
@@ -155,7 +154,7 @@ class LeaderboardService:
         ]
         
         # Cache for 24 hours (Req 24.8)
-        self.cache_service.set(cache_key, result, ttl=86400)
+        self.cache_service.set(cache_key, result, ttl=CacheTTL.L3_LEADERBOARD)
         
         elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
         logger.info(f"Leaderboard retrieved from database for {period} in {elapsed:.2f}ms")
@@ -171,8 +170,24 @@ class LeaderboardService:
         Returns:
             Anonymous username string
         """
-        random_digits = random.randint(1000, 9999)
-        return f"User_{random_digits}"
+        return self._generate_anonymous_usernames(1)[0]
+    
+    def _generate_anonymous_usernames(self, count: int) -> List[str]:
+        """
+        Generate ``count`` distinct anonymous usernames in format User_XXXX.
+        
+        Draws all suffixes in one ``random.sample`` call, so names never
+        repeat within a leaderboard and no per-entry RNG call is needed.
+        
+        Requirement: 24.5
+        
+        Args:
+            count: Number of usernames (at most 9000)
+        
+        Returns:
+            List of anonymous username strings
+        """
+        return [f"User_{digits}" for digits in random.sample(range(1000, 10000), count)]
     
     def _cache_leaderboard(self, period: str, entries: List[LeaderboardEntry]):
         """
@@ -198,7 +213,7 @@ class LeaderboardService:
         ]
         
         # Cache for 24 hours (Req 24.8)
-        self.cache_service.set(cache_key, data, ttl=86400)
+        self.cache_service.set(cache_key, data, ttl=CacheTTL.L3_LEADERBOARD)
         logger.info(f"Leaderboard cached for {period}: {len(entries)} entries")
     
     def update_user_leaderboard_preference(self, user_id: int, opt_out: bool) -> Dict:
@@ -11,6 +11,7 @@ Requirements: 12.1-12.15, 13.1-13.10
 import json
 import hashlib
 import logging
+import re
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -38,6 +39,10 @@ class QuestionService:
     
     VALID_CATEGORIES = {'Technical', 'Behavioral', 'Domain_Specific', 'System_Design', 'Coding'}
     VALID_DIFFICULTIES = {'Easy', 'Medium', 'Hard', 'Expert'}
+    REQUIRED_FIELDS = ('question_text', 'category', 'difficulty', 'expected_answer_points', 'time_limit_seconds')
+    
+    # Content filter (basic profanity check), matched in one pass
+    PROFANITY_PATTERN = re.compile(r'fuck|shit|damn|bitch', re.IGNORECASE)  # Simplified list
     
     def __init__(self, db: Session, cache: Optional[CacheService] = None):
         """Initialize question service"""
@@ -261,8 +266,7 @@ Example format:
         """
         try:
             # Check required fields
-            required_fields = ['question_text', 'category', 'difficulty', 'expected_answer_points', 'time_limit_seconds']
-            for field in required_fields:
+            for field in self.REQUIRED_FIELDS:
                 if field not in question_data:
                     logger.warning(f"Missing required field: {field}")
                     return False
@@ -296,9 +300,7 @@ Example format:
                 return False
             
             # Content filter (basic profanity check)
-            profanity_words = ['fuck', 'shit', 'damn', 'bitch']  # Simplified list
-            question_lower = question_text.lower()
-            if any(word in question_lower for word in profanity_words):
+            if self.PROFANITY_PATTERN.search(question_text):
                 logger.warning(f"Question contains inappropriate content")
                 return False
             
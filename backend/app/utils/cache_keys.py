@@ -149,6 +149,11 @@ class CacheKeyBuilder:
         """Cache key for analytics summary"""
         return f"{CacheKeyBuilder.PREFIX_ANALYTICS}:summary:{user_id}:{period}"
     
+    @staticmethod
+    def analytics_cohort(target_role: str) -> str:
+        """Cache key for a target role's cohort scores"""
+        return f"{CacheKeyBuilder.PREFIX_ANALYTICS}:cohort:{target_role}"
+    
     @staticmethod
     def ai_response(prompt_hash: str) -> str:
         """Cache key for AI responses"""
@@ -190,6 +195,7 @@ class CacheTTL:
     L2_QUESTION_SET = timedelta(minutes=15)
     L3_RESUME_ANALYSIS = timedelta(hours=24)
     L3_ANALYTICS_SUMMARY = timedelta(hours=6)
+    L3_ANALYTICS_COHORT = timedelta(hours=1)
     L3_INTERVIEW_HISTORY = timedelta(hours=12)
     L3_LEADERBOARD = timedelta(hours=24)
     L4_AI_RESPONSE = timedelta(days=30)
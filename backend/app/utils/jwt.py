@@ -1,11 +1,229 @@
 """JWT token generation and validation utilities."""
 
+import base64
+import binascii
+import calendar
+import functools
+import hashlib
+import hmac
+import json
+import threading
+import time
 import jwt
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from app.config import settings
 
 
+# Every token issued here uses the same HS256 header, so encode it once.
+# Serialized exactly like PyJWT does, so tokens stay byte-identical.
+_HEADER_B64 = base64.urlsafe_b64encode(
+    json.dumps({'alg': 'HS256', 'typ': 'JWT'}, separators=(',', ':'), sort_keys=True).encode()
+).rstrip(b'=')
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encode without padding (RFC 7515)."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# Maps the base64url alphabet onto standard base64 for binascii
+_URLSAFE_TO_STD = bytes.maketrans(b'-_', b'+/')
+
+
+def _b64url_decode(data: bytes) -> bytes:
+    """
+    Base64url-decode a segment that may have its padding stripped.
+    
+    Same result as ``base64.urlsafe_b64decode`` but calls binascii directly,
+    skipping the base64 module's per-call argument coercion.
+    """
+    return binascii.a2b_base64(data.translate(_URLSAFE_TO_STD) + b'=' * (-len(data) % 4))
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes as NumericDate (integer epoch seconds)."""
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=1)
+def _signing_key(secret: str) -> bytes:
+    """
+    SECRET_KEY as bytes, encoded once per secret value.
+    
+    Keyed on the secret so a changed SECRET_KEY is picked up.
+    """
+    return secret.encode()
+
+
+# SHA-256 block size; HMAC keys are padded (or hashed down) to this length
+_SHA256_BLOCK_SIZE = 64
+
+
+@functools.lru_cache(maxsize=1)
+def _hmac_contexts(secret: str) -> Tuple[Any, Any, Any]:
+    """
+    Precomputed HMAC-SHA256 state for the secret (RFC 2104).
+    
+    Returns SHA-256 contexts that have already absorbed the inner pad, the
+    inner pad plus ``_HEADER_B64 + b'.'``, and the outer pad. Signing a
+    token then costs two context copies and no key schedule or re-hash of
+    the shared header. Keyed on the secret so a changed SECRET_KEY is
+    picked up.
+    """
+    key = _signing_key(secret)
+    if len(key) > _SHA256_BLOCK_SIZE:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(_SHA256_BLOCK_SIZE, b'\0')
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+    inner_with_header = inner.copy()
+    inner_with_header.update(_HEADER_B64 + b'.')
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+    return inner, inner_with_header, outer
+
+
+def _finish_hmac(inner: Any, outer: Any, message: bytes) -> bytes:
+    """Complete HMAC-SHA256 of ``message`` from precomputed pad contexts."""
+    inner = inner.copy()
+    inner.update(message)
+    outer = outer.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+
+def _sign(signing_input: bytes) -> bytes:
+    """HMAC-SHA256 over the signing input using the application secret."""
+    inner, _, outer = _hmac_contexts(settings.SECRET_KEY)
+    return _finish_hmac(inner, outer, signing_input)
+
+
+def _sign_payload(payload_b64: bytes) -> bytes:
+    """HMAC-SHA256 of ``_HEADER_B64 + b'.' + payload_b64``."""
+    _, inner_with_header, outer = _hmac_contexts(settings.SECRET_KEY)
+    return _finish_hmac(inner_with_header, outer, payload_b64)
+
+
+def _encode_hs256(payload: Dict[str, Any]) -> str:
+    """
+    Encode a payload as an HS256 JWT.
+    
+    Equivalent to ``jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')``
+    but runs the HMAC straight through OpenSSL without PyJWT's per-call
+    algorithm/key preparation.
+    """
+    payload_b64 = _b64url_encode(
+        json.dumps(payload, separators=(',', ':'), default=_json_default).encode()
+    )
+    signature_b64 = _b64url_encode(_sign_payload(payload_b64))
+    return b'.'.join((_HEADER_B64, payload_b64, signature_b64)).decode()
+
+
+def _decode_hs256(token: str) -> Dict[str, Any]:
+    """
+    Verify an HS256 JWT and return its payload.
+    
+    Mirrors ``jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])``:
+    the signature is compared in constant time and the exp/nbf/iat claims are
+    validated with zero leeway. Errors are raised as PyJWT exceptions so
+    callers can keep catching ``jwt.InvalidTokenError``.
+    """
+    try:
+        signing_input, signature_b64 = token.encode().rsplit(b'.', 1)
+        header_b64, payload_b64 = signing_input.split(b'.', 1)
+        header = json.loads(_b64url_decode(header_b64))
+        payload = json.loads(_b64url_decode(payload_b64))
+        signature = _b64url_decode(signature_b64)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise jwt.DecodeError("Invalid token format") from e
+    
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid token format")
+    if header.get('alg') != 'HS256':
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+    if header_b64 == _HEADER_B64:
+        expected = _sign_payload(payload_b64)
+    else:
+        expected = _sign(signing_input)
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    
+    now = int(time.time())
+    try:
+        if 'exp' in payload and int(payload['exp']) <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        if 'nbf' in payload and int(payload['nbf']) > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    except (ValueError, TypeError, OverflowError) as e:
+        raise jwt.DecodeError("Time claims (exp, nbf) must be integers") from e
+    if 'iat' in payload:
+        try:
+            iat = int(payload['iat'])
+        except (ValueError, TypeError, OverflowError) as e:
+            raise jwt.InvalidIssuedAtError("Issued At claim (iat) must be an integer") from e
+        if iat > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+    
+    return payload
+
+
+@functools.lru_cache(maxsize=1)
+def _secret_fingerprint(secret: str) -> bytes:
+    """
+    Short digest identifying the secret, used to scope verify-cache keys.
+    
+    Keyed on the secret so a changed SECRET_KEY is picked up.
+    """
+    return hashlib.sha256(secret.encode()).digest()[:8]
+
+
+# Verified payloads keyed by secret fingerprint + sha256(token), stored with
+# their cache deadline (epoch seconds). Entries never outlive the token's own
+# 'exp' claim, and a rotated SECRET_KEY never hits entries verified under
+# the old one.
+_VERIFY_CACHE_MAXSIZE = 10_000
+_verify_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_verify_cache_lock = threading.RLock()
+
+
+def _cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return a cached payload for the token key, or None on miss/expiry."""
+    with _verify_cache_lock:
+        entry = _verify_cache.get(key)
+        if entry is None:
+            return None
+        deadline, payload = entry
+        if deadline <= time.time():
+            del _verify_cache[key]
+            return None
+        _verify_cache.move_to_end(key)
+        return dict(payload)
+
+
+def _cache_put(key: bytes, payload: Dict[str, Any]) -> None:
+    """Cache a verified payload until min(TTL, token expiry)."""
+    now = time.time()
+    ttl = settings.JWT_VERIFY_CACHE_TTL
+    if 'exp' in payload:
+        # Same int() coercion _decode_hs256 validated the claim with.
+        ttl = min(ttl, int(payload['exp']) - now)
+    if ttl <= 0:
+        return
+    with _verify_cache_lock:
+        _verify_cache[key] = (now + ttl, dict(payload))
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > _VERIFY_CACHE_MAXSIZE:
+            _verify_cache.popitem(last=False)
+
+
+def clear_verify_cache() -> None:
+    """Drop all cached token verification results."""
+    with _verify_cache_lock:
+        _verify_cache.clear()
+
+
 def create_access_token(user_id: int, email: str, role: str = "user") -> str:
     """
     Create JWT access token with 15-minute expiry.
@@ -32,7 +250,7 @@ def create_access_token(user_id: int, email: str, role: str = "user") -> str:
         'exp': now + timedelta(minutes=15),
         'iat': now
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
+    return _encode_hs256(payload)
 
 
 def create_refresh_token(user_id: int) -> str:
@@ -57,18 +275,23 @@ def create_refresh_token(user_id: int) -> str:
         'exp': now + timedelta(days=7),
         'iat': now
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
+    return _encode_hs256(payload)
 
 
-def decode_token(token: str) -> Optional[Dict]:
+def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate JWT token.
     
+    Successfully verified payloads are cached for up to
+    ``settings.JWT_VERIFY_CACHE_TTL`` seconds (never past the token's own
+    expiry), so repeated verification of the same token skips the HMAC and
+    claim checks. Failures are never cached.
+    
     Args:
         token: JWT token string to decode
         
     Returns:
-        Decoded token payload dict, or None if invalid
+        Decoded token payload dict
         
     Raises:
         jwt.ExpiredSignatureError: If token has expired
@@ -80,8 +303,17 @@ def decode_token(token: str) -> Optional[Dict]:
         >>> print(payload['sub'])
         1
     """
+    use_cache = settings.JWT_VERIFY_CACHE_TTL > 0
+    if use_cache:
+        cache_key = _secret_fingerprint(settings.SECRET_KEY) + hashlib.sha256(token.encode()).digest()
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+        payload = _decode_hs256(token)
+        if use_cache:
+            _cache_put(cache_key, payload)
         return payload
     except jwt.ExpiredSignatureError:
         # Token has expired
@@ -91,7 +323,7 @@ def decode_token(token: str) -> Optional[Dict]:
         raise
 
 
-def verify_access_token(token: str) -> Optional[Dict]:
+def verify_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify access token and return payload.
     
@@ -116,7 +348,7 @@ def verify_access_token(token: str) -> Optional[Dict]:
         return None
 
 
-def verify_refresh_token(token: str) -> Optional[Dict]:
+def verify_refresh_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify refresh token and return payload.
     
@@ -145,11 +377,15 @@ def get_token_expiry(token: str) -> Optional[datetime]:
     """
     Get expiry datetime from token.
     
+    Only the payload segment is decoded; the signature is NOT verified, so
+    the result is suitable for display ("expires at") but must never be
+    used to authenticate the token. Use ``decode_token`` for that.
+    
     Args:
         token: JWT token string
         
     Returns:
-        Expiry datetime (UTC), or None if invalid
+        Expiry datetime (UTC), or None if malformed, missing 'exp' or expired
         
     Example:
         >>> token = create_access_token(1, "user@example.com")
@@ -158,10 +394,13 @@ def get_token_expiry(token: str) -> Optional[datetime]:
         2026-02-09 12:30:00
     """
     try:
-        payload = decode_token(token)
-        exp_timestamp = payload.get('exp')
-        if exp_timestamp:
+        _, payload_b64, _ = token.encode().split(b'.')
+        exp_timestamp = json.loads(_b64url_decode(payload_b64)).get('exp')
+        if not exp_timestamp:
+            return None
+        exp_timestamp = int(exp_timestamp)
+        if exp_timestamp > time.time():
             return datetime.utcfromtimestamp(exp_timestamp)
         return None
-    except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
+    except (ValueError, TypeError, AttributeError, UnicodeError, OverflowError, OSError):
         return None
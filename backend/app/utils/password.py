@@ -3,11 +3,13 @@
 import re
 import bcrypt
 from typing import Tuple
+from app.config import settings
 
 
 def hash_password(password: str) -> str:
     """
-    Hash password using bcrypt with cost factor 12.
+    Hash password using bcrypt with cost factor ``settings.BCRYPT_ROUNDS``
+    (12 by default).
     
     Args:
         password: Plain text password to hash
@@ -20,8 +22,8 @@ def hash_password(password: str) -> str:
         >>> print(hashed)
         $2b$12$...
     """
-    # Generate salt with cost factor 12
-    salt = bcrypt.gensalt(rounds=12)
+    # Generate salt with the configured cost factor
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     # Hash the password
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     # Return as string
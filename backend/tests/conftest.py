@@ -2,10 +2,21 @@
 Pytest configuration and fixtures for all tests.
 This file ensures models are properly imported before tests run.
 """
+import itertools
+import os
+
+# bcrypt cost 4 instead of 12: 256x less hashing work per test. Must be set
+# before app.config is imported; tests asserting the production cost
+# override settings.BCRYPT_ROUNDS themselves.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+# No overflow connections in tests: a leaked session exhausts the pool and
+# fails with a TimeoutError instead of quietly opening extra connections.
+os.environ.setdefault("DATABASE_MAX_OVERFLOW", "0")
 
 # Import all models to ensure they're registered with SQLAlchemy Base
 # This must happen before any test creates tables
-from app.models import (  # noqa: F401
+from app.models import (  # noqa: E402,F401
     User,
     AccountStatus,
     ExperienceLevel,
@@ -16,43 +27,170 @@ from app.models import (  # noqa: F401
 )
 
 # Import additional models
-from app.models.question import Question  # noqa: F401
-from app.models.interview_session import InterviewSession, SessionStatus  # noqa: F401
-from app.models.session_question import SessionQuestion  # noqa: F401
-from app.models.answer import Answer  # noqa: F401
-from app.models.answer_draft import AnswerDraft  # noqa: F401
-from app.models.evaluation import Evaluation  # noqa: F401
-from app.models.session_summary import SessionSummary  # noqa: F401
-from app.models.ai_provider_usage import AIProviderUsage  # noqa: F401
-from app.models.study_plan import StudyPlan  # noqa: F401
-from app.models.resume_analysis import ResumeAnalysis  # noqa: F401
+from app.models.question import Question  # noqa: E402,F401
+from app.models.interview_session import InterviewSession, SessionStatus  # noqa: E402,F401
+from app.models.session_question import SessionQuestion  # noqa: E402,F401
+from app.models.answer import Answer  # noqa: E402,F401
+from app.models.answer_draft import AnswerDraft  # noqa: E402,F401
+from app.models.evaluation import Evaluation  # noqa: E402,F401
+from app.models.session_summary import SessionSummary  # noqa: E402,F401
+from app.models.ai_provider_usage import AIProviderUsage  # noqa: E402,F401
+from app.models.study_plan import StudyPlan  # noqa: E402,F401
+from app.models.resume_analysis import ResumeAnalysis  # noqa: E402,F401
 
 
-import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from app.models.base import Base
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pytest_asyncio import is_async_test  # noqa: E402
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker, Session  # noqa: E402
+from app.models.base import Base  # noqa: E402
 
 
-@pytest.fixture(scope="function")
-def db():
+# pytest-xdist worker id ("gw0", "gw1", ...), or "master" when running serially
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+# Test user emails: a random per-process prefix keeps runs and workers
+# apart, a counter keeps users within the run apart
+_EMAIL_PREFIX = f"test-{os.urandom(4).hex()}"
+_email_counter = itertools.count(1)
+
+
+def _unique_email() -> str:
+    return f"{_EMAIL_PREFIX}-{next(_email_counter)}@example.com"
+
+
+def pytest_collection_modifyitems(items):
     """
-    Create a test database session for each test.
+    Run every async test in one session-scoped event loop.
     
-    This fixture uses the actual PostgreSQL database but rolls back
-    all changes after each test to ensure isolation.
+    pytest-asyncio otherwise creates and closes a loop per test.
+    """
+    session_scope_marker = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_schema():
+    """
+    Give each pytest-xdist worker its own PostgreSQL schema.
+    
+    Every connection made by a worker gets its search_path pointed at
+    ``test_<worker>`` and the tables are created there once per worker,
+    so `pytest -n auto` workers never contend on the same rows.
+    Serial runs keep using the default schema untouched.
+    """
+    if XDIST_WORKER == "master":
+        yield
+        return
+    
+    from app.database import engine
+    
+    schema = f"test_{XDIST_WORKER}"
+    
+    @event.listens_for(engine, "connect")
+    def set_search_path(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET search_path TO {schema}")
+        cursor.close()
+    
+    # Drop connections opened before the listener was registered
+    engine.dispose()
+    
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+    Base.metadata.create_all(bind=engine)
+    
+    yield
+    
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    event.remove(engine, "connect", set_search_path)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def relaxed_durability():
+    """
+    Skip the WAL flush on COMMIT for every test connection.
+    
+    The test database is disposable, so waiting for each commit to reach
+    disk is pure overhead. ``synchronous_commit = off`` keeps full
+    transactional semantics and only gives up durability on a server crash.
+    """
+    from app.database import engine
+    
+    @event.listens_for(engine, "connect")
+    def set_synchronous_commit(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("SET synchronous_commit TO OFF")
+        cursor.close()
+    
+    # Drop connections opened before the listener was registered
+    engine.dispose()
+    
+    yield
+    
+    event.remove(engine, "connect", set_synchronous_commit)
+
+
+@pytest.fixture(scope="session")
+def db_connection(worker_schema, relaxed_durability):
+    """
+    Single database connection shared by every test in the session.
+    
+    Tables already exist, so no per-test DDL or reconnect is needed;
+    each test runs inside its own transaction on this connection.
     """
-    from app.database import engine, SessionLocal
+    from app.database import engine
     
-    # Create a connection
     connection = engine.connect()
+    try:
+        yield connection
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_factory(db_connection):
+    """
+    Session factory bound to the shared connection, configured once.
+    
+    Sessions join the connection's open transaction through a SAVEPOINT,
+    so commits and rollbacks issued by the code under test never end it.
+    Test rows are never changed behind the session's back, so objects are
+    not expired on commit and reading an id after commit needs no refresh
+    SELECT.
+    """
+    return sessionmaker(
+        bind=db_connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    )
+
+
+@pytest.fixture(scope="function")
+def db(session_factory, db_connection):
+    """
+    Create a test database session for each test.
     
+    This fixture uses the actual PostgreSQL database but rolls back
+    all changes after each test to ensure isolation. Commits and
+    rollbacks issued by the code under test only touch a SAVEPOINT,
+    so the outer transaction always survives until teardown. When a
+    module-scoped fixture (e.g. module_user) already holds a transaction
+    open, the test runs in a SAVEPOINT nested inside it instead.
+    """
     # Begin a transaction
-    transaction = connection.begin()
+    if db_connection.in_transaction():
+        transaction = db_connection.begin_nested()
+    else:
+        transaction = db_connection.begin()
     
-    # Create session bound to the connection
-    session = SessionLocal(bind=connection)
+    session = session_factory()
     
     try:
         yield session
@@ -60,11 +198,28 @@ def db():
         session.close()
         # Rollback the transaction to undo all changes
         transaction.rollback()
-        connection.close()
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    Session-wide test client.
+    
+    Entering the client runs the app lifespan (startup/shutdown) exactly
+    once for the whole test run instead of once per module or test. One
+    throwaway request then warms the middleware stack and routing, so the
+    first real test (and any response-time assertion in it) is not
+    charged for it.
+    """
+    from app.main import app
+    
+    with TestClient(app) as client:
+        client.get("/api/v1/questions/health")
+        yield client
 
 
 @pytest.fixture
-def client(db: Session):
+def client(db: Session, app_client: TestClient):
     """Create test client with database override"""
     from app.main import app
     from app.database import get_db
@@ -76,26 +231,23 @@ def client(db: Session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
+    yield app_client
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
 def auth_headers(db: Session):
     """Create authenticated user and return auth headers"""
-    import uuid
     from app.utils.jwt import create_access_token
     
     user = User(
-        email=f"test-{uuid.uuid4()}@example.com",
+        email=_unique_email(),
         password_hash="hashed",
         name="Test User",
         target_role="Software Engineer"
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     
     token = create_access_token(user.id, user.email)
     return {"Authorization": f"Bearer {token}"}, user
@@ -104,15 +256,40 @@ def auth_headers(db: Session):
 @pytest.fixture
 def test_user(db: Session):
     """Create a test user"""
-    import uuid
-    
     user = User(
-        email=f"test-{uuid.uuid4()}@example.com",
+        email=_unique_email(),
         password_hash="hashed",
         name="Test User",
         target_role="Software Engineer"
     )
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
+
+
+@pytest.fixture(scope="module")
+def module_user(session_factory, db_connection):
+    """
+    Create a test user shared by every test in a module.
+    
+    The row is inserted inside a module-level transaction that is rolled
+    back once the module finishes; each test's db session nests a SAVEPOINT
+    inside it, so tests see the user but their own changes still roll back.
+    Tests that delete the user should use test_user instead.
+    """
+    transaction = db_connection.begin()
+    session = session_factory()
+    
+    try:
+        user = User(
+            email=_unique_email(),
+            password_hash="hashed",
+            name="Test User",
+            target_role="Software Engineer"
+        )
+        session.add(user)
+        session.commit()
+        yield user
+    finally:
+        session.close()
+        transaction.rollback()
@@ -5,14 +5,11 @@ This module tests the answer draft auto-save functionality.
 
 Requirements: 17.1-17.7
 """
-import pytest
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus
 from app.models.question import Question
 from app.models.interview_session import InterviewSession, SessionStatus
@@ -23,26 +20,11 @@ from app.models.evaluation import Evaluation
 from app.models.session_summary import SessionSummary
 from app.utils.jwt import create_access_token
 
-client = TestClient(app)
-
 
 class TestAnswerDraftEndpoints:
     """Test answer draft auto-save endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self, db: Session):
-        """Override get_db dependency to use test database session"""
-        def override_get_db():
-            try:
-                yield db
-            finally:
-                pass
-        
-        app.dependency_overrides[get_db] = override_get_db
-        yield
-        app.dependency_overrides.clear()
-    
-    def test_save_draft_success(self, db: Session):
+    def test_save_draft_success(self, client: TestClient, db: Session):
         """Test successful draft save"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -54,7 +36,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -79,7 +60,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -115,7 +95,7 @@ class TestAnswerDraftEndpoints:
         assert draft is not None
         assert draft.draft_text == draft_text
     
-    def test_update_existing_draft(self, db: Session):
+    def test_update_existing_draft(self, client: TestClient, db: Session):
         """Test updating an existing draft"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -127,7 +107,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -152,7 +131,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -199,7 +177,7 @@ class TestAnswerDraftEndpoints:
         ).count()
         assert draft_count == 1
     
-    def test_save_draft_without_auth(self, db: Session):
+    def test_save_draft_without_auth(self, client: TestClient, db: Session):
         """Test draft save without authentication"""
         response = client.post(
             "/api/v1/interviews/1/drafts?question_id=1",
@@ -208,7 +186,7 @@ class TestAnswerDraftEndpoints:
         
         assert response.status_code == 403
     
-    def test_save_draft_session_not_found(self, db: Session):
+    def test_save_draft_session_not_found(self, client: TestClient, db: Session):
         """Test draft save with non-existent session"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -220,7 +198,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -232,7 +209,7 @@ class TestAnswerDraftEndpoints:
         
         assert response.status_code == 404
     
-    def test_get_draft_success(self, db: Session):
+    def test_get_draft_success(self, client: TestClient, db: Session):
         """Test successful draft retrieval"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -244,7 +221,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -269,7 +245,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create draft
         draft_text = "Saved draft text"
@@ -297,7 +272,7 @@ class TestAnswerDraftEndpoints:
         assert data["draft_text"] == draft_text
         assert "last_saved_at" in data
     
-    def test_get_draft_not_found(self, db: Session):
+    def test_get_draft_not_found(self, client: TestClient, db: Session):
         """Test draft retrieval when no draft exists"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -309,7 +284,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -334,7 +308,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -346,7 +319,7 @@ class TestAnswerDraftEndpoints:
         
         assert response.status_code == 404
     
-    def test_delete_draft_success(self, db: Session):
+    def test_delete_draft_success(self, client: TestClient, db: Session):
         """Test successful draft deletion"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -358,7 +331,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -383,7 +355,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create draft
         draft = AnswerDraft(
@@ -412,7 +383,7 @@ class TestAnswerDraftEndpoints:
         draft = db.query(AnswerDraft).filter(AnswerDraft.id == draft_id).first()
         assert draft is None
     
-    def test_delete_draft_not_found(self, db: Session):
+    def test_delete_draft_not_found(self, client: TestClient, db: Session):
         """Test draft deletion when no draft exists (should succeed)"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -424,7 +395,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -449,7 +419,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -461,7 +430,7 @@ class TestAnswerDraftEndpoints:
         
         assert response.status_code == 204
     
-    def test_draft_deleted_on_answer_submission(self, db: Session):
+    def test_draft_deleted_on_answer_submission(self, client: TestClient, db: Session):
         """Test that draft is automatically deleted when answer is submitted"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -473,7 +442,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -498,7 +466,6 @@ class TestAnswerDraftEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -5,14 +5,11 @@ This module tests the answer submission endpoint for interview sessions.
 
 Requirements: 16.1-16.10
 """
-import pytest
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus, ExperienceLevel
 from app.models.question import Question
 from app.models.interview_session import InterviewSession, SessionStatus
@@ -23,26 +20,11 @@ from app.models.evaluation import Evaluation
 from app.models.session_summary import SessionSummary
 from app.utils.jwt import create_access_token
 
-client = TestClient(app)
-
 
 class TestAnswerSubmissionEndpoint:
     """Test answer submission endpoint"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self, db: Session):
-        """Override get_db dependency to use test database session"""
-        def override_get_db():
-            try:
-                yield db
-            finally:
-                pass
-        
-        app.dependency_overrides[get_db] = override_get_db
-        yield
-        app.dependency_overrides.clear()
-    
-    def test_submit_answer_success(self, db: Session):
+    def test_submit_answer_success(self, client: TestClient, db: Session):
         """Test successful answer submission"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -54,7 +36,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -79,7 +60,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -133,7 +113,7 @@ class TestAnswerSubmissionEndpoint:
         assert session.status == SessionStatus.COMPLETED
         assert session.end_time is not None
     
-    def test_submit_answer_without_auth(self, db: Session):
+    def test_submit_answer_without_auth(self, client: TestClient, db: Session):
         """Test answer submission without authentication"""
         response = client.post(
             "/api/v1/interviews/1/answers?question_id=1",
@@ -142,7 +122,7 @@ class TestAnswerSubmissionEndpoint:
         
         assert response.status_code == 403
     
-    def test_submit_answer_session_not_found(self, db: Session):
+    def test_submit_answer_session_not_found(self, client: TestClient, db: Session):
         """Test answer submission with non-existent session"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -154,7 +134,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -167,7 +146,7 @@ class TestAnswerSubmissionEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_submit_answer_wrong_user(self, db: Session):
+    def test_submit_answer_wrong_user(self, client: TestClient, db: Session):
         """Test answer submission from another user's session"""
         # Create first user and session
         user1_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -179,7 +158,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user1)
         db.commit()
-        db.refresh(user1)
         
         # Create question
         question = Question(
@@ -204,7 +182,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -226,7 +203,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user2)
         db.commit()
-        db.refresh(user2)
         
         # Try to submit answer with user2's token
         token = create_access_token(user_id=user2.id, email=user2.email)
@@ -240,7 +216,7 @@ class TestAnswerSubmissionEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_submit_answer_question_not_in_session(self, db: Session):
+    def test_submit_answer_question_not_in_session(self, client: TestClient, db: Session):
         """Test answer submission for question not in session"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -252,7 +228,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create questions
         question1 = Question(
@@ -285,7 +260,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Add only question1 to session
         sq = SessionQuestion(
@@ -309,7 +283,7 @@ class TestAnswerSubmissionEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_submit_answer_too_short(self, db: Session):
+    def test_submit_answer_too_short(self, client: TestClient, db: Session):
         """Test answer submission with text too short"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -321,7 +295,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -346,7 +319,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question
         sq = SessionQuestion(
@@ -369,7 +341,7 @@ class TestAnswerSubmissionEndpoint:
         
         assert response.status_code == 422  # Validation error
     
-    def test_submit_answer_already_answered(self, db: Session):
+    def test_submit_answer_already_answered(self, client: TestClient, db: Session):
         """Test submitting answer to already answered question"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -381,7 +353,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -406,7 +377,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create answer
         answer = Answer(
@@ -443,7 +413,7 @@ class TestAnswerSubmissionEndpoint:
         assert response.status_code == 400
         assert "already answered" in response.json()["detail"].lower()
     
-    def test_submit_answer_multiple_questions_partial(self, db: Session):
+    def test_submit_answer_multiple_questions_partial(self, client: TestClient, db: Session):
         """Test submitting answer when not all questions are answered"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -455,7 +425,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create questions
         questions = []
@@ -483,7 +452,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session questions
         for idx, question in enumerate(questions, start=1):
@@ -515,7 +483,7 @@ class TestAnswerSubmissionEndpoint:
         assert session.status == SessionStatus.IN_PROGRESS
         assert session.end_time is None
     
-    def test_submit_answer_time_calculation(self, db: Session):
+    def test_submit_answer_time_calculation(self, client: TestClient, db: Session):
         """Test time_taken calculation"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -527,7 +495,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create question
         question = Question(
@@ -552,7 +519,6 @@ class TestAnswerSubmissionEndpoint:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create session question with specific display time
         display_time = datetime.utcnow() - timedelta(seconds=180)  # 3 minutes ago
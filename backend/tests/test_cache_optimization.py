@@ -382,17 +382,8 @@ class TestCacheMonitoringService:
 
 
 @pytest.fixture
-def db():
-    """Database session fixture with cleanup."""
-    from app.database import SessionLocal
-    db = SessionLocal()
-    try:
-        # Clean up cache_metadata table before each test
-        db.query(CacheMetadata).delete()
-        db.commit()
-        yield db
-    finally:
-        # Clean up after test
-        db.query(CacheMetadata).delete()
-        db.commit()
-        db.close()
+def db(db):
+    """Shared rollback session with an empty cache_metadata table."""
+    # Deleted inside the test transaction, so the rows come back on rollback
+    db.query(CacheMetadata).delete()
+    return db
@@ -7,21 +7,6 @@ from app.database import get_db
 from app.models import User, AccountStatus, ExperienceLevel
 from app.models.base import Base
 import uuid
-from app.main import app
-
-
-@pytest.fixture(autouse=True)
-def setup(db: Session):
-    """Override get_db dependency to use test database session"""
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-    
-    app.dependency_overrides[get_db] = override_get_db
-    yield
-    app.dependency_overrides.clear()
 
 
 def test_user_model_creation(db: Session):
@@ -5,15 +5,12 @@ This module tests the evaluation API endpoints.
 
 Requirements: 18.1-18.14
 """
-import pytest
 import uuid
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus
 from app.models.question import Question
 from app.models.answer import Answer
@@ -24,26 +21,11 @@ from app.models.answer_draft import AnswerDraft
 from app.models.session_summary import SessionSummary
 from app.utils.jwt import create_access_token
 
-client = TestClient(app)
-
 
 class TestEvaluationEndpoints:
     """Test evaluation endpoints"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self, db: Session):
-        """Override get_db dependency to use test database session"""
-        def override_get_db():
-            try:
-                yield db
-            finally:
-                pass
-        
-        app.dependency_overrides[get_db] = override_get_db
-        yield
-        app.dependency_overrides.clear()
-    
-    def test_evaluate_answer_success(self, db: Session):
+    def test_evaluate_answer_success(self, client: TestClient, db: Session):
         """Test successful answer evaluation"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -56,7 +38,6 @@ class TestEvaluationEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create interview session
         session = InterviewSession(
@@ -68,7 +49,6 @@ class TestEvaluationEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create question
         question = Question(
@@ -97,7 +77,6 @@ class TestEvaluationEndpoints:
         )
         db.add(answer)
         db.commit()
-        db.refresh(answer)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -151,7 +130,7 @@ class TestEvaluationEndpoints:
             assert len(data['feedback']['strengths']) == 3
             assert len(data['feedback']['improvements']) == 2
     
-    def test_evaluate_answer_without_auth(self, db: Session):
+    def test_evaluate_answer_without_auth(self, client: TestClient, db: Session):
         """Test evaluation without authentication"""
         response = client.post(
             "/api/v1/evaluations/evaluate",
@@ -160,7 +139,7 @@ class TestEvaluationEndpoints:
         
         assert response.status_code == 403
     
-    def test_evaluate_answer_not_found(self, db: Session):
+    def test_evaluate_answer_not_found(self, client: TestClient, db: Session):
         """Test evaluation with non-existent answer"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -172,7 +151,6 @@ class TestEvaluationEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -184,7 +162,7 @@ class TestEvaluationEndpoints:
         
         assert response.status_code == 404
     
-    def test_evaluate_answer_access_denied(self, db: Session):
+    def test_evaluate_answer_access_denied(self, client: TestClient, db: Session):
         """Test evaluation of another user's answer"""
         # Create two users
         unique_email1 = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -218,7 +196,6 @@ class TestEvaluationEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create question
         question = Question(
@@ -243,7 +220,6 @@ class TestEvaluationEndpoints:
         )
         db.add(answer)
         db.commit()
-        db.refresh(answer)
         
         # Try to evaluate with user2's token
         token = create_access_token(user_id=user2.id, email=user2.email)
@@ -256,7 +232,7 @@ class TestEvaluationEndpoints:
         
         assert response.status_code == 403
     
-    def test_evaluate_already_evaluated_answer(self, db: Session):
+    def test_evaluate_already_evaluated_answer(self, client: TestClient, db: Session):
         """Test evaluation of already evaluated answer"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -268,7 +244,6 @@ class TestEvaluationEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create interview session
         session = InterviewSession(
@@ -280,7 +255,6 @@ class TestEvaluationEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create question
         question = Question(
@@ -333,7 +307,7 @@ class TestEvaluationEndpoints:
         assert response.status_code == 400
         assert "already evaluated" in response.json()['detail'].lower()
     
-    def test_get_evaluation_success(self, db: Session):
+    def test_get_evaluation_success(self, client: TestClient, db: Session):
         """Test successful evaluation retrieval"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -345,7 +319,6 @@ class TestEvaluationEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create interview session
         session = InterviewSession(
@@ -357,7 +330,6 @@ class TestEvaluationEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create question
         question = Question(
@@ -415,7 +387,7 @@ class TestEvaluationEndpoints:
         assert data['scores']['overall_score'] == 82.0
         assert len(data['feedback']['strengths']) == 1
     
-    def test_get_evaluation_not_yet_evaluated(self, db: Session):
+    def test_get_evaluation_not_yet_evaluated(self, client: TestClient, db: Session):
         """Test getting evaluation for unevaluated answer"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -427,7 +399,6 @@ class TestEvaluationEndpoints:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create interview session
         session = InterviewSession(
@@ -439,7 +410,6 @@ class TestEvaluationEndpoints:
         )
         db.add(session)
         db.commit()
-        db.refresh(session)
         
         # Create question
         question = Question(
@@ -464,7 +434,6 @@ class TestEvaluationEndpoints:
         )
         db.add(answer)
         db.commit()
-        db.refresh(answer)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -0,0 +1,61 @@
+"""
+Unit tests for resume file validation utilities
+
+Tests Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 6.6, 6.7, 6.8, 6.9
+"""
+
+
+class TestFileValidation:
+    """Test file validation utilities"""
+    
+    def test_validate_file_extension_pdf(self):
+        """Test PDF extension validation"""
+        from app.utils.file_upload import validate_file_extension
+        
+        assert validate_file_extension("resume.pdf") is True
+        assert validate_file_extension("resume.PDF") is True
+    
+    def test_validate_file_extension_docx(self):
+        """Test DOCX extension validation"""
+        from app.utils.file_upload import validate_file_extension
+        
+        assert validate_file_extension("resume.docx") is True
+        assert validate_file_extension("resume.DOCX") is True
+    
+    def test_validate_file_extension_invalid(self):
+        """Test invalid extension validation"""
+        from app.utils.file_upload import validate_file_extension
+        
+        assert validate_file_extension("resume.txt") is False
+        assert validate_file_extension("resume.doc") is False
+        assert validate_file_extension("resume.jpg") is False
+    
+    def test_validate_file_size_valid(self):
+        """Test valid file size"""
+        from app.utils.file_upload import validate_file_size, MAX_FILE_SIZE
+        
+        assert validate_file_size(1024) is True  # 1KB
+        assert validate_file_size(MAX_FILE_SIZE) is True  # Exactly 10MB
+    
+    def test_validate_file_size_invalid(self):
+        """Test invalid file size"""
+        from app.utils.file_upload import validate_file_size, MAX_FILE_SIZE
+        
+        assert validate_file_size(MAX_FILE_SIZE + 1) is False  # Over 10MB
+    
+    def test_generate_unique_filename(self):
+        """Test unique filename generation"""
+        from app.utils.file_upload import generate_unique_filename
+        
+        filename1 = generate_unique_filename("resume.pdf")
+        filename2 = generate_unique_filename("resume.pdf")
+        
+        # Should be different
+        assert filename1 != filename2
+        
+        # Should contain original extension
+        assert filename1.endswith(".pdf")
+        assert filename2.endswith(".pdf")
+        
+        # Should contain UUID prefix
+        assert len(filename1) > len("resume.pdf")
@@ -5,13 +5,10 @@ This module tests the interview session creation endpoint.
 
 Requirements: 14.1-14.10
 """
-import pytest
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus, ExperienceLevel
 from app.models.question import Question
 from app.models.answer import Answer  # Import to ensure model is registered
@@ -21,26 +18,11 @@ from app.models.session_summary import SessionSummary  # Import to ensure model
 from app.models.evaluation import Evaluation  # Import to ensure model is registered
 from app.utils.jwt import create_access_token
 
-client = TestClient(app)
-
 
 class TestInterviewSessionEndpoint:
     """Test interview session creation endpoint"""
     
-    @pytest.fixture(autouse=True)
-    def setup(self, db: Session):
-        """Override get_db dependency to use test database session"""
-        def override_get_db():
-            try:
-                yield db
-            finally:
-                pass
-        
-        app.dependency_overrides[get_db] = override_get_db
-        yield
-        app.dependency_overrides.clear()
-    
-    def test_create_session_success(self, db: Session, mocker):
+    def test_create_session_success(self, client: TestClient, db: Session, mocker):
         """Test successful session creation"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -54,7 +36,6 @@ class TestInterviewSessionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create test questions
         for i in range(5):
@@ -106,7 +87,7 @@ class TestInterviewSessionEndpoint:
         assert "first_question" in data
         assert data["first_question"]["question_number"] == 1
     
-    def test_create_session_without_auth(self, db: Session):
+    def test_create_session_without_auth(self, client: TestClient, db: Session):
         """Test session creation without authentication"""
         response = client.post(
             "/api/v1/interviews",
@@ -120,7 +101,7 @@ class TestInterviewSessionEndpoint:
         # Auth middleware returns 403 when no token provided
         assert response.status_code == 403
     
-    def test_create_session_invalid_difficulty(self, db: Session):
+    def test_create_session_invalid_difficulty(self, client: TestClient, db: Session):
         """Test session creation with invalid difficulty"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -132,7 +113,6 @@ class TestInterviewSessionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -148,7 +128,7 @@ class TestInterviewSessionEndpoint:
         
         assert response.status_code == 422  # Validation error
     
-    def test_create_session_invalid_question_count(self, db: Session):
+    def test_create_session_invalid_question_count(self, client: TestClient, db: Session):
         """Test session creation with invalid question count"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -160,7 +140,6 @@ class TestInterviewSessionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -188,7 +167,7 @@ class TestInterviewSessionEndpoint:
         )
         assert response.status_code == 422
     
-    def test_create_session_invalid_categories(self, db: Session):
+    def test_create_session_invalid_categories(self, client: TestClient, db: Session):
         """Test session creation with invalid categories"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -200,7 +179,6 @@ class TestInterviewSessionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -217,7 +195,7 @@ class TestInterviewSessionEndpoint:
         
         assert response.status_code == 422
     
-    def test_create_session_without_categories(self, db: Session, mocker):
+    def test_create_session_without_categories(self, client: TestClient, db: Session, mocker):
         """Test session creation without categories (optional field)"""
         # Create user
         unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
@@ -229,7 +207,6 @@ class TestInterviewSessionEndpoint:
         )
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         # Create test questions
         for i in range(3):
@@ -270,7 +247,7 @@ class TestInterviewSessionEndpoint:
         data = response.json()
         assert data["categories"] is None
     
-    def test_health_check(self):
+    def test_health_check(self, client: TestClient):
         """Test health check endpoint"""
         response = client.get("/api/v1/interviews/health")
         
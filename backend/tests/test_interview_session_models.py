@@ -20,6 +20,15 @@ from app.models.evaluation import Evaluation
 from app.models.session_summary import SessionSummary
 
 
+# Shared SessionSummary payloads, built once at import time
+_SUMMARY_STRENGTHS = ("Clear communication", "Good examples", "Structured answers")
+_SUMMARY_RADAR = {"content": 85, "clarity": 80, "confidence": 78, "technical": 87}
+_SUMMARY_LINE = (
+    {"date": "2026-02-01", "score": 75},
+    {"date": "2026-02-12", "score": 82.5},
+)
+
+
 class TestInterviewSessionModel:
     """Test InterviewSession model"""
     
@@ -215,7 +224,7 @@ class TestAnswerModel:
         assert answer.session_id == session.id
         assert answer.question_id == question.id
         assert answer.user_id == user.id
-        assert len(answer.answer_text) > 0
+        assert answer.answer_text
         assert answer.time_taken == 180
         assert answer.submitted_at is not None
 
@@ -276,7 +285,7 @@ class TestAnswerDraftModel:
         assert draft.session_id == session.id
         assert draft.question_id == question.id
         assert draft.user_id == user.id
-        assert len(draft.draft_text) > 0
+        assert draft.draft_text
         assert draft.last_saved_at is not None
 
 
@@ -402,11 +411,11 @@ class TestSessionSummaryModel:
             avg_technical_accuracy=87.0,
             score_trend=5.2,
             previous_session_score=78.3,
-            top_strengths=["Clear communication", "Good examples", "Structured answers"],
+            top_strengths=list(_SUMMARY_STRENGTHS),
             top_improvements=["Add more metrics", "Discuss trade-offs", "Mention tools"],
             category_performance={"Technical": 85.0, "Behavioral": 80.0},
-            radar_chart_data={"content": 85, "clarity": 80, "confidence": 78, "technical": 87},
-            line_chart_data=[{"date": "2026-02-01", "score": 75}, {"date": "2026-02-12", "score": 82.5}],
+            radar_chart_data=_SUMMARY_RADAR,
+            line_chart_data=list(_SUMMARY_LINE),
             total_questions=5,
             total_time_seconds=1500,
             generated_at=datetime.utcnow()
@@ -1,19 +1,43 @@
 """Unit tests for JWT token generation and validation."""
 
+import calendar
 import pytest
 import jwt
 from datetime import datetime, timedelta
+from unittest.mock import patch
+from freezegun import freeze_time
+from app.utils import jwt as jwt_utils
 from app.utils.jwt import (
     create_access_token,
     create_refresh_token,
     decode_token,
     verify_access_token,
     verify_refresh_token,
-    get_token_expiry
+    get_token_expiry,
+    clear_verify_cache
 )
 from app.config import settings
 
 
+# Frozen clock for tests that assert exact iat/exp values
+FROZEN_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def access_payload():
+    """Decoded claims of one access token shared by the claim tests."""
+    token = create_access_token(123, "test@example.com")
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+
+
+@pytest.fixture(scope="module")
+def refresh_payload():
+    """Decoded claims of one refresh token shared by the claim tests."""
+    token = create_refresh_token(456)
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+
+
+@freeze_time(FROZEN_NOW)
 class TestAccessTokenGeneration:
     """Test access token generation."""
     
@@ -23,17 +47,15 @@ class TestAccessTokenGeneration:
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_access_token_contains_user_id(self):
-        """Test that access token contains user ID in sub claim."""
-        token = create_access_token(123, "user@example.com")
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['sub'] == 123
-    
-    def test_access_token_contains_email(self):
-        """Test that access token contains email."""
-        token = create_access_token(1, "test@example.com")
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['email'] == "test@example.com"
+    @pytest.mark.parametrize("field,expected", [
+        ("sub", 123),
+        ("email", "test@example.com"),
+        ("role", "user"),
+        ("type", "access"),
+    ])
+    def test_access_token_claims(self, access_payload, field, expected):
+        """Test that access token carries user ID, email, default role and type."""
+        assert access_payload[field] == expected
     
     def test_access_token_contains_role(self):
         """Test that access token contains role."""
@@ -41,43 +63,19 @@ class TestAccessTokenGeneration:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
         assert payload['role'] == "admin"
     
-    def test_access_token_default_role(self):
-        """Test that access token has default role 'user'."""
+    def test_access_token_issued_at_and_expiry(self):
+        """Test that access token is issued now and expires in 15 minutes."""
         token = create_access_token(1, "user@example.com")
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['role'] == "user"
-    
-    def test_access_token_has_type(self):
-        """Test that access token has type 'access'."""
-        token = create_access_token(1, "user@example.com")
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['type'] == "access"
-    
-    def test_access_token_expiry_15_minutes(self):
-        """Test that access token expires in 15 minutes."""
-        token = create_access_token(1, "user@example.com")
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        
-        exp_time = datetime.fromtimestamp(payload['exp'])
-        iat_time = datetime.fromtimestamp(payload['iat'])
-        
-        # Should be approximately 15 minutes (allow 1 second tolerance)
-        diff = (exp_time - iat_time).total_seconds()
-        assert 899 <= diff <= 901  # 15 minutes = 900 seconds
-    
-    def test_access_token_has_issued_at(self):
-        """Test that access token has issued at timestamp."""
-        before = datetime.utcnow()
-        token = create_access_token(1, "user@example.com")
-        after = datetime.utcnow()
         
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
+        exp_time = datetime.utcfromtimestamp(payload['exp'])
         iat_time = datetime.utcfromtimestamp(payload['iat'])
         
-        # Allow 1 second tolerance due to timestamp precision
-        assert (before - timedelta(seconds=1)) <= iat_time <= (after + timedelta(seconds=1))
+        assert iat_time == FROZEN_NOW
+        assert exp_time - iat_time == timedelta(minutes=15)
 
 
+@freeze_time(FROZEN_NOW)
 class TestRefreshTokenGeneration:
     """Test refresh token generation."""
     
@@ -87,36 +85,28 @@ class TestRefreshTokenGeneration:
         assert isinstance(token, str)
         assert len(token) > 0
     
-    def test_refresh_token_contains_user_id(self):
-        """Test that refresh token contains user ID in sub claim."""
-        token = create_refresh_token(456)
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['sub'] == 456
-    
-    def test_refresh_token_has_type(self):
-        """Test that refresh token has type 'refresh'."""
-        token = create_refresh_token(1)
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert payload['type'] == "refresh"
+    @pytest.mark.parametrize("field,expected", [
+        ("sub", 456),
+        ("type", "refresh"),
+    ])
+    def test_refresh_token_claims(self, refresh_payload, field, expected):
+        """Test that refresh token carries user ID and type."""
+        assert refresh_payload[field] == expected
     
-    def test_refresh_token_no_email(self):
+    def test_refresh_token_no_email(self, refresh_payload):
         """Test that refresh token does not contain email."""
-        token = create_refresh_token(1)
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-        assert 'email' not in payload
+        assert 'email' not in refresh_payload
     
     def test_refresh_token_expiry_7_days(self):
-        """Test that refresh token expires in 7 days."""
+        """Test that refresh token is issued now and expires in 7 days."""
         token = create_refresh_token(1)
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
         
-        exp_time = datetime.fromtimestamp(payload['exp'])
-        iat_time = datetime.fromtimestamp(payload['iat'])
+        exp_time = datetime.utcfromtimestamp(payload['exp'])
+        iat_time = datetime.utcfromtimestamp(payload['iat'])
         
-        # Should be approximately 7 days (allow 1 second tolerance)
-        diff = (exp_time - iat_time).total_seconds()
-        expected = 7 * 24 * 60 * 60  # 604800 seconds
-        assert expected - 1 <= diff <= expected + 1
+        assert iat_time == FROZEN_NOW
+        assert exp_time - iat_time == timedelta(days=7)
 
 
 class TestTokenDecoding:
@@ -167,6 +157,66 @@ class TestTokenDecoding:
         
         with pytest.raises(jwt.InvalidTokenError):
             decode_token(wrong_token)
+    
+    def test_decode_tampered_payload(self):
+        """Test that a token with a modified payload fails verification."""
+        token = create_access_token(1, "user@example.com", role="user")
+        header, _, signature = token.split('.')
+        forged = jwt.encode(
+            {'sub': 1, 'role': 'admin', 'type': 'access'}, "wrong_secret_key", algorithm='HS256'
+        ).split('.')[1]
+        
+        with pytest.raises(jwt.InvalidSignatureError):
+            decode_token(f"{header}.{forged}.{signature}")
+    
+    def test_decode_rejects_other_algorithms(self):
+        """Test that tokens signed with a non-HS256 algorithm are rejected."""
+        token = jwt.encode({'sub': 1}, settings.SECRET_KEY, algorithm='HS512')
+        
+        with pytest.raises(jwt.InvalidAlgorithmError):
+            decode_token(token)
+    
+    def test_secret_rotation_invalidates_tokens(self, monkeypatch):
+        """Test that the signing context and verify cache follow SECRET_KEY."""
+        clear_verify_cache()
+        token = create_access_token(1, "user@example.com")
+        # Verified once under the old secret, so the payload is cached
+        assert decode_token(token)['sub'] == 1
+        monkeypatch.setattr(settings, 'SECRET_KEY', "rotated-secret-key-0123456789abcdef")
+        
+        with pytest.raises(jwt.InvalidSignatureError):
+            decode_token(token)
+        assert decode_token(create_access_token(1, "user@example.com"))['sub'] == 1
+    
+    def test_encoding_matches_pyjwt(self):
+        """Test that tokens are byte-identical to PyJWT's HS256 output."""
+        now = datetime.utcnow()
+        payload = {'sub': 1, 'email': "user@example.com", 'exp': now + timedelta(minutes=15), 'iat': now}
+        
+        expected = jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
+        
+        assert jwt_utils._encode_hs256(payload) == expected
+    
+    @pytest.mark.parametrize("secret", [
+        "s" * 32,
+        "k" * 64,
+        "long-secret-" * 10,  # Longer than the SHA-256 block, hashed first
+    ])
+    def test_precomputed_hmac_matches_stdlib(self, monkeypatch, secret):
+        """Test that the precomputed-pad HMAC equals hmac.digest for any key length."""
+        import hmac
+        monkeypatch.setattr(settings, 'SECRET_KEY', secret)
+        message = b"header.payload"
+        
+        assert jwt_utils._sign(message) == hmac.digest(secret.encode(), message, 'sha256')
+    
+    @pytest.mark.parametrize("raw", [b"", b"a", b"ab", b"abc", bytes(range(256))])
+    def test_b64url_decode_matches_stdlib(self, raw):
+        """Test that the unpadded base64url decoder round-trips any length."""
+        import base64
+        encoded = base64.urlsafe_b64encode(raw).rstrip(b'=')
+        
+        assert jwt_utils._b64url_decode(encoded) == raw
 
 
 class TestTokenVerification:
@@ -225,42 +275,44 @@ class TestTokenVerification:
         assert result is None
 
 
+@freeze_time(FROZEN_NOW)
 class TestTokenExpiry:
     """Test token expiry functionality."""
     
     def test_get_expiry_from_access_token(self):
         """Test getting expiry from access token."""
-        before = datetime.utcnow()
         token = create_access_token(1, "user@example.com")
-        after = datetime.utcnow()
         
         expiry = get_token_expiry(token)
         
-        assert expiry is not None
-        # Expiry should be ~15 minutes from now
-        expected_min = before + timedelta(minutes=14, seconds=59)
-        expected_max = after + timedelta(minutes=15, seconds=1)
-        assert expected_min <= expiry <= expected_max
+        assert expiry == FROZEN_NOW + timedelta(minutes=15)
     
     def test_get_expiry_from_refresh_token(self):
         """Test getting expiry from refresh token."""
-        before = datetime.utcnow()
         token = create_refresh_token(1)
-        after = datetime.utcnow()
         
         expiry = get_token_expiry(token)
         
-        assert expiry is not None
-        # Expiry should be ~7 days from now
-        expected_min = before + timedelta(days=6, hours=23, minutes=59)
-        expected_max = after + timedelta(days=7, seconds=1)
-        assert expected_min <= expiry <= expected_max
+        assert expiry == FROZEN_NOW + timedelta(days=7)
     
     def test_get_expiry_from_invalid_token(self):
         """Test getting expiry from invalid token returns None."""
         expiry = get_token_expiry("invalid.token.here")
         assert expiry is None
     
+    def test_get_expiry_with_numeric_string_exp(self):
+        """Test that a numeric-string 'exp' claim is read as epoch seconds."""
+        exp = FROZEN_NOW + timedelta(minutes=5)
+        token = jwt.encode({'sub': 1, 'exp': str(calendar.timegm(exp.utctimetuple()))}, settings.SECRET_KEY, algorithm='HS256')
+        
+        assert get_token_expiry(token) == exp
+    
+    def test_get_expiry_with_out_of_range_exp(self):
+        """Test that an 'exp' past the datetime range returns None."""
+        token = jwt.encode({'sub': 1, 'exp': 10 ** 20}, settings.SECRET_KEY, algorithm='HS256')
+        
+        assert get_token_expiry(token) is None
+    
     def test_get_expiry_from_expired_token(self):
         """Test getting expiry from expired token returns None."""
         now = datetime.utcnow()
@@ -273,6 +325,85 @@ class TestTokenExpiry:
         
         expiry = get_token_expiry(expired_token)
         assert expiry is None
+    
+    def test_get_expiry_does_not_verify_signature(self):
+        """Test that expiry is read from the payload without an HMAC check."""
+        token = jwt.encode(
+            {'sub': 1, 'exp': FROZEN_NOW + timedelta(minutes=5)},
+            "another-secret-key-that-is-32-chars-long",
+            algorithm='HS256'
+        )
+        
+        with patch.object(jwt_utils, '_decode_hs256') as mock_decode:
+            expiry = get_token_expiry(token)
+        
+        assert expiry == FROZEN_NOW + timedelta(minutes=5)
+        mock_decode.assert_not_called()
+
+
+class TestVerificationCache:
+    """Test caching of verified token payloads."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        clear_verify_cache()
+        yield
+        clear_verify_cache()
+    
+    def test_repeated_decode_verifies_once(self):
+        """Test that decoding the same token twice only verifies it once."""
+        token = create_access_token(1, "user@example.com")
+        
+        with patch.object(jwt_utils, '_decode_hs256', wraps=jwt_utils._decode_hs256) as mock_decode:
+            first = decode_token(token)
+            second = verify_access_token(token)
+        
+        assert mock_decode.call_count == 1
+        assert first == second
+    
+    def test_cached_payload_is_a_copy(self):
+        """Test that mutating a returned payload does not poison the cache."""
+        token = create_access_token(1, "user@example.com")
+        
+        decode_token(token)['type'] = 'refresh'
+        
+        assert verify_access_token(token) is not None
+    
+    def test_invalid_token_not_cached(self):
+        """Test that verification failures are never cached."""
+        with patch.object(jwt_utils, '_decode_hs256', wraps=jwt_utils._decode_hs256) as mock_decode:
+            assert verify_access_token("invalid.token.here") is None
+            assert verify_access_token("invalid.token.here") is None
+        
+        assert mock_decode.call_count == 2
+    
+    def test_cache_disabled_with_zero_ttl(self, monkeypatch):
+        """Test that a zero TTL disables the cache."""
+        monkeypatch.setattr(settings, 'JWT_VERIFY_CACHE_TTL', 0)
+        token = create_access_token(1, "user@example.com")
+        
+        with patch.object(jwt_utils, '_decode_hs256', wraps=jwt_utils._decode_hs256) as mock_decode:
+            decode_token(token)
+            decode_token(token)
+        
+        assert mock_decode.call_count == 2
+    
+    def test_numeric_string_exp_is_cached(self):
+        """Test that a numeric-string 'exp' claim is accepted and cached."""
+        exp = calendar.timegm((datetime.utcnow() + timedelta(minutes=5)).utctimetuple())
+        token = jwt.encode({'sub': '1', 'type': 'access', 'exp': str(exp)}, settings.SECRET_KEY, algorithm='HS256')
+        
+        with patch.object(jwt_utils, '_decode_hs256', wraps=jwt_utils._decode_hs256) as mock_decode:
+            assert verify_access_token(token)['exp'] == str(exp)
+            assert verify_access_token(token) is not None
+        
+        assert mock_decode.call_count == 1
+    
+    def test_overflowing_exp_is_rejected(self):
+        """Test that an 'exp' too large for int() fails as an invalid token."""
+        token = jwt.encode({'sub': '1', 'type': 'access', 'exp': 1e309}, settings.SECRET_KEY, algorithm='HS256')
+        
+        assert verify_access_token(token) is None
 
 
 class TestTokenIntegration:
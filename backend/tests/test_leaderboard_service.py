@@ -4,63 +4,87 @@ Requirements: 24.1-24.10
 """
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import Mock
+from sqlalchemy import insert
+from app.services.cache_service import CacheService
 from app.services.leaderboard_service import LeaderboardService
 from app.models.user import User
 from app.models.interview_session import InterviewSession
 from app.models.session_summary import SessionSummary
 from app.models.leaderboard_entry import LeaderboardEntry
+from app.utils.cache_keys import CacheKeys, CacheTTL
+
+
+def _insert_users(db, prefix, count, opt_out=lambda i: False):
+    """Bulk-insert ``count`` active users and return their IDs in order."""
+    rows = [
+        {
+            "email": f"{prefix}{i}@example.com",
+            "password_hash": "hashed",
+            "name": f"{prefix} {i}",
+            "account_status": "active",
+            "leaderboard_opt_out": opt_out(i),
+        }
+        for i in range(count)
+    ]
+    return list(db.scalars(insert(User).returning(User.id, sort_by_parameter_order=True), rows))
+
+
+def _insert_scored_sessions(db, sessions):
+    """
+    Bulk-insert completed sessions with summaries.
+    
+    ``sessions`` is a list of ``(user_id, score, created_at)`` tuples;
+    ``created_at`` may be None to mean "now".
+    """
+    now = datetime.utcnow()
+    session_rows = [
+        {
+            "user_id": user_id,
+            "role": "Software Engineer",
+            "difficulty": "medium",
+            "status": "completed",
+            "question_count": 5,
+            "created_at": created_at or now,
+        }
+        for user_id, _, created_at in sessions
+    ]
+    session_ids = db.scalars(
+        insert(InterviewSession).returning(InterviewSession.id, sort_by_parameter_order=True),
+        session_rows
+    )
+    
+    db.execute(insert(SessionSummary), [
+        {
+            "session_id": session_id,
+            "overall_session_score": score,
+            "total_questions": 5,
+            "total_time_seconds": 300,
+            "avg_content_quality": score,
+            "avg_clarity": score,
+            "avg_confidence": score,
+            "avg_technical_accuracy": score,
+            "top_strengths": [],
+            "top_improvements": [],
+            "category_performance": {},
+        }
+        for session_id, (_, score, _) in zip(session_ids, sessions)
+    ])
+    db.commit()
 
 
 class TestLeaderboardService:
     """Test suite for LeaderboardService."""
     
-    def test_calculate_weekly_leaderboard(self, db, test_user):
+    def test_calculate_weekly_leaderboard(self, db):
         """Test weekly leaderboard calculation."""
-        # Create test users with sessions
-        users = []
-        for i in range(15):
-            user = User(
-                email=f"user{i}@example.com",
-                password_hash="hashed",
-                name=f"User {i}",
-                account_status="active",
-                leaderboard_opt_out=False
-            )
-            db.add(user)
-            users.append(user)
-        db.commit()
-        
-        # Create sessions for last 7 days
-        for i, user in enumerate(users):
-            # Create 3 sessions per user
-            for j in range(3):
-                session = InterviewSession(
-                    user_id=user.id,
-                    role="Software Engineer",
-                    difficulty="medium",
-                    status="completed",
-                    question_count=5,
-                    created_at=datetime.utcnow() - timedelta(days=j)
-                )
-                db.add(session)
-                db.flush()
-                
-                summary = SessionSummary(
-                    session_id=session.id,
-                    overall_session_score=90 - i,  # Descending scores
-                    total_questions=5,
-                    total_time_seconds=300,
-                    avg_content_quality=90.0,
-                    avg_clarity=90.0,
-                    avg_confidence=90.0,
-                    avg_technical_accuracy=90.0,
-                    top_strengths=[],
-                    top_improvements=[],
-                    category_performance={}
-                )
-                db.add(summary)
-        
-        db.commit()
+        # Create test users with 3 sessions each over the last 7 days
+        user_ids = _insert_users(db, "user", 15)
+        _insert_scored_sessions(db, [
+            (user_id, 90 - i, datetime.utcnow() - timedelta(days=j))  # Descending scores
+            for i, user_id in enumerate(user_ids)
+            for j in range(3)
+        ])
         
         # Calculate leaderboard
         service = LeaderboardService(db)
@@ -79,49 +103,12 @@ class TestLeaderboardService:
     
     def test_calculate_all_time_leaderboard(self, db):
         """Test all-time leaderboard calculation."""
-        # Create users with old sessions
-        users = []
-        for i in range(5):
-            user = User(
-                email=f"alltime{i}@example.com",
-                password_hash="hashed",
-                name=f"AllTime User {i}",
-                account_status="active",
-                leaderboard_opt_out=False
-            )
-            db.add(user)
-            users.append(user)
-        db.commit()
-        
-        # Create sessions from 30 days ago
-        for i, user in enumerate(users):
-            session = InterviewSession(
-                user_id=user.id,
-                role="Software Engineer",
-                difficulty="medium",
-                status="completed",
-                question_count=5,
-                created_at=datetime.utcnow() - timedelta(days=30)
-            )
-            db.add(session)
-            db.flush()
-            
-            summary = SessionSummary(
-                session_id=session.id,
-                overall_session_score=85 + i,
-                total_questions=5,
-                total_time_seconds=300,
-                avg_content_quality=85.0,
-                avg_clarity=85.0,
-                avg_confidence=85.0,
-                avg_technical_accuracy=85.0,
-                top_strengths=[],
-                top_improvements=[],
-                category_performance={}
-            )
-            db.add(summary)
-        
-        db.commit()
+        # Create users with sessions from 30 days ago
+        user_ids = _insert_users(db, "alltime", 5)
+        _insert_scored_sessions(db, [
+            (user_id, 85 + i, datetime.utcnow() - timedelta(days=30))
+            for i, user_id in enumerate(user_ids)
+        ])
         
         # Calculate all-time leaderboard
         service = LeaderboardService(db)
@@ -134,48 +121,9 @@ class TestLeaderboardService:
     
     def test_leaderboard_opt_out(self, db):
         """Test that opted-out users are excluded from leaderboard."""
-        # Create users, some opted out
-        users = []
-        for i in range(5):
-            user = User(
-                email=f"optout{i}@example.com",
-                password_hash="hashed",
-                name=f"OptOut User {i}",
-                account_status="active",
-                leaderboard_opt_out=True if i < 2 else False  # First 2 opt out
-            )
-            db.add(user)
-            users.append(user)
-        db.commit()
-        
-        # Create sessions for all users
-        for user in users:
-            session = InterviewSession(
-                user_id=user.id,
-                role="Software Engineer",
-                difficulty="medium",
-                status="completed",
-                question_count=5
-            )
-            db.add(session)
-            db.flush()
-            
-            summary = SessionSummary(
-                session_id=session.id,
-                overall_session_score=90.0,
-                total_questions=5,
-                total_time_seconds=300,
-                avg_content_quality=90.0,
-                avg_clarity=90.0,
-                avg_confidence=90.0,
-                avg_technical_accuracy=90.0,
-                top_strengths=[],
-                top_improvements=[],
-                category_performance={}
-            )
-            db.add(summary)
-        
-        db.commit()
+        # Create users, first 2 opted out, with a session each
+        user_ids = _insert_users(db, "optout", 5, opt_out=lambda i: i < 2)
+        _insert_scored_sessions(db, [(user_id, 90.0, None) for user_id in user_ids])
         
         # Calculate leaderboard
         service = LeaderboardService(db)
@@ -187,31 +135,7 @@ class TestLeaderboardService:
     def test_get_leaderboard_from_cache(self, db, test_user):
         """Test retrieving leaderboard from cache."""
         # Create and calculate leaderboard
-        session = InterviewSession(
-            user_id=test_user.id,
-            role="Software Engineer",
-            difficulty="medium",
-            status="completed",
-            question_count=5
-        )
-        db.add(session)
-        db.flush()
-        
-        summary = SessionSummary(
-            session_id=session.id,
-            overall_session_score=95.0,
-            total_questions=5,
-            total_time_seconds=300,
-            avg_content_quality=95.0,
-            avg_clarity=95.0,
-            avg_confidence=95.0,
-            avg_technical_accuracy=95.0,
-            top_strengths=[],
-            top_improvements=[],
-            category_performance={}
-        )
-        db.add(summary)
-        db.commit()
+        _insert_scored_sessions(db, [(test_user.id, 95.0, None)])
         
         service = LeaderboardService(db)
         
@@ -228,6 +152,25 @@ class TestLeaderboardService:
         assert len(result) == 1
         assert result[0]['average_score'] == 95.0
     
+    def test_leaderboard_cached_in_redis_with_ttl(self, db):
+        """Test that calculated leaderboards are written to Redis with a TTL."""
+        cache = Mock(spec=CacheService)
+        cache.get.return_value = None
+        service = LeaderboardService(db, cache_service=cache)
+        
+        service.calculate_leaderboard('weekly')
+        
+        key, data = cache.set.call_args.args
+        assert key == CacheKeys.leaderboard('weekly')
+        assert cache.set.call_args.kwargs['ttl'] == CacheTTL.L3_LEADERBOARD
+        
+        # Cache hit is served without touching the database
+        cache.get.return_value = data
+        db_query = Mock(wraps=db.query)
+        service.db = Mock(query=db_query)
+        assert service.get_leaderboard('weekly') == data
+        db_query.assert_not_called()
+    
     def test_update_leaderboard_preference(self, db, test_user):
         """Test updating user's leaderboard preference."""
         service = LeaderboardService(db)
@@ -278,52 +221,23 @@ class TestLeaderboardService:
             assert digits.isdigit()
             assert 1000 <= int(digits) <= 9999
     
+    def test_anonymous_usernames_unique_per_batch(self, db):
+        """Test that one leaderboard never repeats an anonymous username."""
+        service = LeaderboardService(db)
+        
+        usernames = service._generate_anonymous_usernames(9000)
+        
+        assert len(set(usernames)) == 9000
+        assert all(name.startswith("User_") and len(name) == 9 for name in usernames)
+    
     def test_leaderboard_ranking_order(self, db):
         """Test that leaderboard ranks users by average score descending."""
         # Create users with specific scores
         scores = [95.0, 88.0, 92.0, 85.0, 90.0]
-        users = []
-        
-        for i, score in enumerate(scores):
-            user = User(
-                email=f"rank{i}@example.com",
-                password_hash="hashed",
-                name=f"Rank User {i}",
-                account_status="active",
-                leaderboard_opt_out=False
-            )
-            db.add(user)
-            users.append(user)
-        db.commit()
-        
-        # Create sessions with specific scores
-        for user, score in zip(users, scores):
-            session = InterviewSession(
-                user_id=user.id,
-                role="Software Engineer",
-                difficulty="medium",
-                status="completed",
-                question_count=5
-            )
-            db.add(session)
-            db.flush()
-            
-            summary = SessionSummary(
-                session_id=session.id,
-                overall_session_score=score,
-                total_questions=5,
-                total_time_seconds=300,
-                avg_content_quality=score,
-                avg_clarity=score,
-                avg_confidence=score,
-                avg_technical_accuracy=score,
-                top_strengths=[],
-                top_improvements=[],
-                category_performance={}
-            )
-            db.add(summary)
-        
-        db.commit()
+        user_ids = _insert_users(db, "rank", len(scores))
+        _insert_scored_sessions(db, [
+            (user_id, score, None) for user_id, score in zip(user_ids, scores)
+        ])
         
         # Calculate leaderboard
         service = LeaderboardService(db)
@@ -341,33 +255,7 @@ class TestLeaderboardService:
     def test_leaderboard_total_interviews_count(self, db, test_user):
         """Test that total_interviews is correctly counted."""
         # Create multiple sessions
-        for i in range(5):
-            session = InterviewSession(
-                user_id=test_user.id,
-                role="Software Engineer",
-                difficulty="medium",
-                status="completed",
-                question_count=5
-            )
-            db.add(session)
-            db.flush()
-            
-            summary = SessionSummary(
-                session_id=session.id,
-                overall_session_score=90.0,
-                total_questions=5,
-                total_time_seconds=300,
-                avg_content_quality=90.0,
-                avg_clarity=90.0,
-                avg_confidence=90.0,
-                avg_technical_accuracy=90.0,
-                top_strengths=[],
-                top_improvements=[],
-                category_performance={}
-            )
-            db.add(summary)
-        
-        db.commit()
+        _insert_scored_sessions(db, [(test_user.id, 90.0, None)] * 5)
         
         # Calculate leaderboard
         service = LeaderboardService(db)
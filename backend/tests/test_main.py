@@ -3,29 +3,36 @@ Tests for main application endpoints
 """
 import pytest
 from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
-
-def test_health_check():
+def test_health_check(app_client: TestClient):
     """
-    Test health check endpoint returns 200 OK.
+    Test health check endpoint returns 200 OK with an X-Request-ID header.
     """
-    response = client.get("/health")
+    response = app_client.get("/health")
     assert response.status_code == 200
     
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
     assert "environment" in data
+    assert data["database"] == "connected"
+    assert response.headers["content-type"] == "application/json"
+    
+    # All responses include X-Request-ID header
+    assert "X-Request-ID" in response.headers
+    assert len(response.headers["X-Request-ID"]) > 0
+    
+    # Request IDs are unique per request
+    next_response = app_client.get("/health")
+    assert next_response.headers["X-Request-ID"] != response.headers["X-Request-ID"]
 
 
-def test_root_endpoint():
+def test_root_endpoint(app_client: TestClient):
     """
     Test root endpoint returns API information.
     """
-    response = client.get("/")
+    response = app_client.get("/")
     assert response.status_code == 200
     
     data = response.json()
@@ -34,20 +41,11 @@ def test_root_endpoint():
     assert data["name"] == "InterviewMaster AI"
 
 
-def test_request_id_header():
-    """
-    Test that all responses include X-Request-ID header.
-    """
-    response = client.get("/health")
-    assert "X-Request-ID" in response.headers
-    assert len(response.headers["X-Request-ID"]) > 0
-
-
-def test_cors_headers():
+def test_cors_headers(app_client: TestClient):
     """
     Test CORS headers are present.
     """
-    response = client.options(
+    response = app_client.options(
         "/health",
         headers={
             "Origin": "http://localhost:3000",
@@ -1,9 +1,14 @@
 """Unit tests for password hashing and validation utilities."""
 
 import pytest
+from app.config import settings
 from app.utils.password import hash_password, verify_password, validate_password_strength
 
 
+# Every character accepted by the special-character rule
+SPECIAL_CHARS = list("!@#$%^&*(),.?\":{}|<>")
+
+
 class TestPasswordHashing:
     """Test password hashing functionality."""
     
@@ -27,13 +32,22 @@ class TestPasswordHashing:
         hashed = hash_password(password)
         assert hashed.startswith("$2b$")
     
-    def test_hash_password_contains_cost_factor_12(self):
+    def test_hash_password_contains_cost_factor_12(self, monkeypatch):
         """Test that hashed password uses cost factor 12."""
+        # Test runs default to a low cost; check the production value
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 12)
         password = "MySecurePass123!"
         hashed = hash_password(password)
         # Format: $2b$12$...
         cost_factor = hashed.split("$")[2]
         assert cost_factor == "12"
+    
+    def test_hash_password_uses_configured_cost_factor(self, monkeypatch):
+        """Test that the cost factor follows settings.BCRYPT_ROUNDS."""
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+        hashed = hash_password("MySecurePass123!")
+        assert hashed.split("$")[2] == "05"
+        assert verify_password("MySecurePass123!", hashed) is True
 
 
 class TestPasswordVerification:
@@ -73,35 +87,18 @@ class TestPasswordVerification:
 class TestPasswordStrengthValidation:
     """Test password strength validation functionality."""
     
-    def test_validate_password_too_short(self):
-        """Test that password shorter than 8 characters fails."""
-        is_valid, error = validate_password_strength("Short1!")
-        assert is_valid is False
-        assert "at least 8 characters" in error
-    
-    def test_validate_password_no_uppercase(self):
-        """Test that password without uppercase letter fails."""
-        is_valid, error = validate_password_strength("lowercase123!")
-        assert is_valid is False
-        assert "uppercase letter" in error
-    
-    def test_validate_password_no_lowercase(self):
-        """Test that password without lowercase letter fails."""
-        is_valid, error = validate_password_strength("UPPERCASE123!")
-        assert is_valid is False
-        assert "lowercase letter" in error
-    
-    def test_validate_password_no_number(self):
-        """Test that password without number fails."""
-        is_valid, error = validate_password_strength("NoNumbers!")
-        assert is_valid is False
-        assert "number" in error
-    
-    def test_validate_password_no_special_character(self):
-        """Test that password without special character fails."""
-        is_valid, error = validate_password_strength("NoSpecial123")
+    @pytest.mark.parametrize("password,expected_fragment", [
+        ("Short1!", "at least 8 characters"),
+        ("lowercase123!", "uppercase letter"),
+        ("UPPERCASE123!", "lowercase letter"),
+        ("NoNumbers!", "number"),
+        ("NoSpecial123", "special character"),
+    ])
+    def test_validate_password_missing_requirement(self, password, expected_fragment):
+        """Test that a password missing one requirement fails with its message."""
+        is_valid, error = validate_password_strength(password)
         assert is_valid is False
-        assert "special character" in error
+        assert expected_fragment in error
     
     def test_validate_password_valid_password(self):
         """Test that valid password passes all checks."""
@@ -115,13 +112,11 @@ class TestPasswordStrengthValidation:
         assert is_valid is True
         assert error == ""
     
-    def test_validate_password_various_special_characters(self):
-        """Test that various special characters are accepted."""
-        special_chars = "!@#$%^&*(),.?\":{}|<>"
-        for char in special_chars:
-            password = f"Password123{char}"
-            is_valid, error = validate_password_strength(password)
-            assert is_valid is True, f"Failed for special character: {char}"
+    @pytest.mark.parametrize("char", SPECIAL_CHARS)
+    def test_validate_password_special_character(self, char):
+        """Test that each accepted special character satisfies the check."""
+        is_valid, error = validate_password_strength(f"Password123{char}")
+        assert is_valid is True
     
     def test_validate_password_long_password(self):
         """Test that long passwords are accepted."""
@@ -1,49 +1,91 @@
 """Unit tests for password reset endpoints."""
 
+import hashlib
+import secrets
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import uuid
+from datetime import datetime, timedelta
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus
 from app.models.password_reset_token import PasswordResetToken
+from app.utils.password import hash_password, verify_password
 
-client = TestClient(app)
 
+# Known reset token standing in for the emailed one. Tests roll back
+# between runs, so one value can be reused everywhere.
+_RESET_TOKEN = secrets.token_urlsafe(32)
+_RESET_TOKEN_HASH = hashlib.sha256(_RESET_TOKEN.encode()).hexdigest()
 
-@pytest.fixture(autouse=True)
-def setup(db: Session):
-    """Override get_db dependency to use test database session"""
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
-    
-    app.dependency_overrides[get_db] = override_get_db
-    yield
-    app.dependency_overrides.clear()
+# Tests use the shared `client` fixture from conftest.py: one TestClient for
+# the whole run, with get_db bound to the SAVEPOINT-isolated `db` session.
+
+
+# bcrypt hashes of test passwords, computed once per password
+_PASSWORD_HASHES = {}
 
 
+def _password_hash(password):
+    """bcrypt hash of a test password, computed once per password."""
+    if password not in _PASSWORD_HASHES:
+        _PASSWORD_HASHES[password] = hash_password(password)
+    return _PASSWORD_HASHES[password]
 
 
 def create_user(db, email=None, password="SecurePass123!", name="Test User"):
-    """Helper function to create a user."""
+    """Helper function to insert an active user directly, skipping registration."""
     if email is None:
         email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    client.post(
-        "/api/v1/auth/register",
-        json={
-            "email": email,
-            "password": password,
-            "name": name
-        }
+    user = User(
+        email=email,
+        password_hash=_password_hash(password),
+        name=name,
+        account_status=AccountStatus.ACTIVE
     )
+    db.add(user)
+    db.commit()
+    return user
+
 
+@pytest.fixture
+def fast_password(monkeypatch):
+    """
+    Short-circuit login password checks for users made by create_user.
+    
+    A stored hash that is exactly the memoized hash of the submitted
+    password is a match without running bcrypt; anything else (e.g. a hash
+    written by the reset endpoint) still goes through the real check.
+    """
+    def _fast_verify(plain_password, hashed_password):
+        if _PASSWORD_HASHES.get(plain_password) == hashed_password:
+            return True
+        return verify_password(plain_password, hashed_password)
+    
+    monkeypatch.setattr("app.services.auth_service.verify_password", _fast_verify)
 
-def test_password_reset_request_success(db: Session):
+
+@pytest.fixture
+def primed_reset_token(db: Session):
+    """
+    Active user with a valid, unused reset token.
+    
+    Inserted directly, standing in for the user following the emailed link
+    after a password-reset-request. Returns ``(email, plaintext_token)``.
+    """
+    user = create_user(db)
+    db.add(PasswordResetToken(
+        user_id=user.id,
+        token_hash=_RESET_TOKEN_HASH,
+        expires_at=(datetime.utcnow() + timedelta(hours=1)).isoformat(),
+        is_used=False
+    ))
+    db.commit()
+    return user.email, _RESET_TOKEN
+
+
+def test_password_reset_request_success(client: TestClient, db: Session):
     """Test successful password reset request."""
     unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
     create_user(db, email=unique_email)
@@ -58,7 +100,7 @@ def test_password_reset_request_success(db: Session):
     assert "email exists" in data["message"].lower()
 
 
-def test_password_reset_request_nonexistent_email(db: Session):
+def test_password_reset_request_nonexistent_email(client: TestClient, db: Session):
     """Test password reset request with non-existent email."""
     response = client.post(
         "/api/v1/auth/password-reset-request",
@@ -71,53 +113,25 @@ def test_password_reset_request_nonexistent_email(db: Session):
     assert "email exists" in data["message"].lower()
 
 
-def test_password_reset_request_creates_token(db: Session):
+def test_password_reset_request_creates_token(client: TestClient, db: Session):
     """Test that password reset request creates token in database."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
+    user = create_user(db)
     
     client.post(
         "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
+        json={"email": user.email}
     )
     
-    # Check database for token
-    pass  # Using db fixture
-    token_record = db.query(PasswordResetToken).first()
-    assert token_record is not None
-    assert token_record.is_used is False
-    pass  # Using db fixture
+    # Check database for the user's token (id is known, no User lookup)
+    is_used = db.scalar(
+        select(PasswordResetToken.is_used).where(PasswordResetToken.user_id == user.id)
+    )
+    assert is_used is False
 
 
-def test_password_reset_success(db: Session):
+def test_password_reset_success(client: TestClient, primed_reset_token):
     """Test successful password reset."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
-    
-    # Request password reset
-    client.post(
-        "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
-    )
-    
-    # Get token from database (in production, user would get this from email)
-    pass  # Using db fixture
-    user = db.query(User).filter(User.email == unique_email).first()
-    token_record = db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id
-    ).order_by(PasswordResetToken.created_at.desc()).first()
-    
-    # Generate the actual token (we need to reverse the hash - in real scenario, token is in email)
-    # For testing, we'll create a new token with known value
-    import secrets
-    import hashlib
-    from datetime import datetime, timedelta
-    reset_token = secrets.token_urlsafe(32)
-    token_record.token_hash = hashlib.sha256(reset_token.encode()).hexdigest()
-    token_record.expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-    token_record.is_used = False
-    db.commit()
-    pass  # Using db fixture
+    _, reset_token = primed_reset_token
     
     # Reset password
     response = client.post(
@@ -133,7 +147,7 @@ def test_password_reset_success(db: Session):
     assert data["message"] == "Password reset successfully"
 
 
-def test_password_reset_invalid_token(db: Session):
+def test_password_reset_invalid_token(client: TestClient, db: Session):
     """Test password reset with invalid token."""
     response = client.post(
         "/api/v1/auth/password-reset",
@@ -147,32 +161,9 @@ def test_password_reset_invalid_token(db: Session):
     assert "Invalid or expired" in response.json()["detail"]
 
 
-def test_password_reset_weak_password(db: Session):
+def test_password_reset_weak_password(client: TestClient, primed_reset_token):
     """Test password reset with weak password."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
-    
-    # Request password reset
-    client.post(
-        "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
-    )
-    
-    # Get token
-    pass  # Using db fixture
-    user = db.query(User).filter(User.email == unique_email).first()
-    token_record = db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id
-    ).order_by(PasswordResetToken.created_at.desc()).first()
-    import secrets
-    import hashlib
-    from datetime import datetime, timedelta
-    reset_token = secrets.token_urlsafe(32)
-    token_record.token_hash = hashlib.sha256(reset_token.encode()).hexdigest()
-    token_record.expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-    token_record.is_used = False
-    db.commit()
-    pass  # Using db fixture
+    _, reset_token = primed_reset_token
     
     # Try to reset with weak password
     response = client.post(
@@ -186,32 +177,9 @@ def test_password_reset_weak_password(db: Session):
     assert response.status_code == 422
 
 
-def test_password_reset_token_used_once(db: Session):
+def test_password_reset_token_used_once(client: TestClient, primed_reset_token):
     """Test that password reset token can only be used once."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
-    
-    # Request password reset
-    client.post(
-        "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
-    )
-    
-    # Get token
-    pass  # Using db fixture
-    user = db.query(User).filter(User.email == unique_email).first()
-    token_record = db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id
-    ).order_by(PasswordResetToken.created_at.desc()).first()
-    import secrets
-    import hashlib
-    from datetime import datetime, timedelta
-    reset_token = secrets.token_urlsafe(32)
-    token_record.token_hash = hashlib.sha256(reset_token.encode()).hexdigest()
-    token_record.expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-    token_record.is_used = False
-    db.commit()
-    pass  # Using db fixture
+    _, reset_token = primed_reset_token
     
     # Reset password first time
     response1 = client.post(
@@ -237,50 +205,22 @@ def test_password_reset_token_used_once(db: Session):
     assert "Invalid or expired" in response2.json()["detail"]
 
 
-def test_password_reset_invalidates_refresh_tokens(db: Session):
+@pytest.mark.usefixtures("fast_password")
+def test_password_reset_invalidates_refresh_tokens(client: TestClient, primed_reset_token):
     """Test that password reset invalidates all refresh tokens."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
-    
-    # Update user to active and login
-    pass  # Using db fixture
-    user = db.query(User).filter(User.email == unique_email).first()
-    user.account_status = AccountStatus.ACTIVE
-    db.commit()
-    pass  # Using db fixture
+    email, reset_token = primed_reset_token
     
     # Login to get refresh token
     login_response = client.post(
         "/api/v1/auth/login",
         json={
-            "email": unique_email,
+            "email": email,
             "password": "SecurePass123!"
         }
     )
     
     refresh_token = login_response.json()["refresh_token"]
     
-    # Request password reset
-    client.post(
-        "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
-    )
-    
-    # Get reset token
-    pass  # Using db fixture
-    token_record = db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id
-    ).order_by(PasswordResetToken.created_at.desc()).first()
-    import secrets
-    import hashlib
-    from datetime import datetime, timedelta
-    reset_token = secrets.token_urlsafe(32)
-    token_record.token_hash = hashlib.sha256(reset_token.encode()).hexdigest()
-    token_record.expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-    token_record.is_used = False
-    db.commit()
-    pass  # Using db fixture
-    
     # Reset password
     client.post(
         "/api/v1/auth/password-reset",
@@ -300,38 +240,10 @@ def test_password_reset_invalidates_refresh_tokens(db: Session):
     assert "revoked" in response.json()["detail"].lower()
 
 
-def test_password_reset_allows_login_with_new_password(db: Session):
+@pytest.mark.usefixtures("fast_password")
+def test_password_reset_allows_login_with_new_password(client: TestClient, primed_reset_token):
     """Test that user can login with new password after reset."""
-    unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-    create_user(db, email=unique_email)
-    
-    # Update user to active
-    pass  # Using db fixture
-    user = db.query(User).filter(User.email == unique_email).first()
-    user.account_status = AccountStatus.ACTIVE
-    db.commit()
-    pass  # Using db fixture
-    
-    # Request password reset
-    client.post(
-        "/api/v1/auth/password-reset-request",
-        json={"email": unique_email}
-    )
-    
-    # Get reset token
-    pass  # Using db fixture
-    token_record = db.query(PasswordResetToken).filter(
-        PasswordResetToken.user_id == user.id
-    ).order_by(PasswordResetToken.created_at.desc()).first()
-    import secrets
-    import hashlib
-    from datetime import datetime, timedelta
-    reset_token = secrets.token_urlsafe(32)
-    token_record.token_hash = hashlib.sha256(reset_token.encode()).hexdigest()
-    token_record.expires_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-    token_record.is_used = False
-    db.commit()
-    pass  # Using db fixture
+    email, reset_token = primed_reset_token
     
     # Reset password
     client.post(
@@ -346,7 +258,7 @@ def test_password_reset_allows_login_with_new_password(db: Session):
     response = client.post(
         "/api/v1/auth/login",
         json={
-            "email": unique_email,
+            "email": email,
             "password": "NewSecurePass123!"
         }
     )
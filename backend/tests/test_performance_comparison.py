@@ -3,14 +3,18 @@ Tests for performance comparison feature.
 
 Requirements: 21.1-21.8
 """
+import uuid
+
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import Mock
 from sqlalchemy.orm import Session
 
 from app.services.analytics_service import AnalyticsService
 from app.services.cache_service import CacheService
+from app.utils.cache_keys import CacheKeys, CacheTTL
 from app.models.user import User
-from app.models.interview_session import InterviewSession
+from app.models.interview_session import InterviewSession, SessionStatus
 from app.models.answer import Answer
 from app.models.evaluation import Evaluation
 from app.models.session_question import SessionQuestion
@@ -39,6 +43,10 @@ class TestPerformanceComparison:
         # User with score 60 should be at 0th percentile (0 out of 9 below)
         percentile = analytics_service._calculate_percentile(60.0, cohort_scores)
         assert percentile == 0.0
+        
+        # Tied scores do not count as below the user
+        percentile = analytics_service._calculate_percentile(70.0, [60.0, 70.0, 70.0, 80.0])
+        assert percentile == 25.0
     
     def test_get_cohort_stats(self, db: Session):
         """Test cohort statistics calculation."""
@@ -62,6 +70,15 @@ class TestPerformanceComparison:
         assert stats.score_distribution["70-80"] == 2  # 70, 75
         assert stats.score_distribution["80-90"] == 2  # 80, 85
         assert stats.score_distribution["90-100"] == 3  # 90, 95, 100
+        
+        # Unsorted input and scores exactly on bucket edges
+        stats = analytics_service._get_cohort_stats(
+            "Software Engineer", [(1, 90.0), (2, 59.9), (3, 60.0), (4, 89.99)]
+        )
+        assert stats.cohort_median_score == 75.0
+        assert stats.score_distribution == {
+            "0-60": 1, "60-70": 1, "70-80": 0, "80-90": 1, "90-100": 1
+        }
     
     def test_determine_performance_level(self, db: Session):
         """Test performance level determination."""
@@ -86,4 +103,97 @@ class TestPerformanceComparison:
         
         desc = analytics_service._generate_rank_description(20.0, "Software Engineer", 100)
         assert "keep practicing" in desc.lower()
+    
+    def test_user_cohort_cached_per_role(self, db: Session):
+        """Test that cohort scores are cached per target role and reused."""
+        cache_service = Mock(spec=CacheService)
+        cache_service.get.return_value = None
+        analytics_service = AnalyticsService(db, cache_service)
+        
+        cohort = analytics_service._get_user_cohort("Cohort Cache Role")
+        
+        key = CacheKeys.analytics_cohort("Cohort Cache Role")
+        cache_service.set.assert_called_once_with(key, cohort, ttl=CacheTTL.L3_ANALYTICS_COHORT)
+        
+        # Cache hit is served without querying the database
+        cache_service.get.return_value = [[1, 60.0], [2, 80.0]]
+        analytics_service.db = Mock()
+        assert analytics_service._get_user_cohort("Cohort Cache Role") == [(1, 60.0), (2, 80.0)]
+        analytics_service.db.query.assert_not_called()
+    
+    def test_user_cohort_only_includes_completed_sessions_for_role(self, db: Session):
+        """Test that the cohort is filtered to the role's completed sessions."""
+        question = _add_question(db)
+        included = _add_scored_user(db, question, "Filtered Cohort Role", [70.0, 90.0])
+        _add_scored_user(db, question, "Filtered Cohort Role", [10.0], status=SessionStatus.ABANDONED)
+        _add_scored_user(db, question, "Other Cohort Role", [50.0])
+        
+        cache_service = Mock(spec=CacheService)
+        cache_service.get.return_value = None
+        analytics_service = AnalyticsService(db, cache_service)
+        
+        assert analytics_service._get_user_cohort("Filtered Cohort Role") == [(included.id, 80.0)]
+
+
+def _add_question(db: Session) -> Question:
+    question = Question(
+        question_text="Cohort question",
+        category="Technical",
+        difficulty="Medium",
+        role="Cohort Role",
+        expected_answer_points=["Point"],
+        time_limit_seconds=300
+    )
+    db.add(question)
+    db.flush()
+    return question
+
 
+def _add_scored_user(
+    db: Session,
+    question: Question,
+    target_role: str,
+    scores: list[float],
+    status: SessionStatus = SessionStatus.COMPLETED
+) -> User:
+    """Insert a user with one session whose answers are evaluated at ``scores``."""
+    user = User(
+        email=f"cohort_{uuid.uuid4().hex[:8]}@example.com",
+        password_hash="hashed",
+        name="Cohort User",
+        target_role=target_role
+    )
+    db.add(user)
+    db.flush()
+    session = InterviewSession(
+        user_id=user.id,
+        role=target_role,
+        difficulty="Medium",
+        status=status,
+        question_count=len(scores)
+    )
+    db.add(session)
+    db.flush()
+    for score in scores:
+        answer = Answer(
+            session_id=session.id,
+            question_id=question.id,
+            user_id=user.id,
+            answer_text="Answer",
+            time_taken=60
+        )
+        db.add(answer)
+        db.flush()
+        db.add(Evaluation(
+            answer_id=answer.id,
+            overall_score=score,
+            content_quality=score,
+            clarity=score,
+            confidence=score,
+            technical_accuracy=score,
+            strengths=[],
+            improvements=[],
+            suggestions=[]
+        ))
+    db.flush()
+    return user
@@ -5,14 +5,11 @@ This module tests the question retrieval endpoint during interview sessions.
 
 Requirements: 15.1-15.7
 """
-import pytest
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.main import app
-from app.database import get_db
 from app.models.user import User, AccountStatus, ExperienceLevel
 from app.models.question import Question
 from app.models.interview_session import InterviewSession, SessionStatus
@@ -23,77 +20,57 @@ from app.models.evaluation import Evaluation
 from app.models.session_summary import SessionSummary
 from app.utils.jwt import create_access_token
 
-client = TestClient(app)
 
+def _make_user(name: str = "Test User") -> User:
+    """Build an active user with a unique email (not yet added to the session)."""
+    return User(
+        email=f"test_{uuid.uuid4().hex[:8]}@example.com",
+        password_hash="hashed_password",
+        name=name,
+        account_status=AccountStatus.ACTIVE
+    )
 
-class TestQuestionDisplayEndpoint:
-    """Test question display endpoint"""
-    
-    @pytest.fixture(autouse=True)
-    def setup(self, db: Session):
-        """Override get_db dependency to use test database session"""
-        def override_get_db():
-            try:
-                yield db
-            finally:
-                pass
-        
-        app.dependency_overrides[get_db] = override_get_db
-        yield
-        app.dependency_overrides.clear()
-    
-    def test_get_question_success(self, db: Session):
-        """Test successful question retrieval"""
-        # Create user
-        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user = User(
-            email=unique_email,
-            password_hash="hashed_password",
-            name="Test User",
-            account_status=AccountStatus.ACTIVE
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        
-        # Create questions
-        questions = []
-        for i in range(3):
-            question = Question(
-                question_text=f"Test question {i+1}",
+
+def _seed_session(db: Session, user: User, question_count: int = 1) -> InterviewSession:
+    """
+    Insert an in-progress session for ``user`` with ``question_count`` pending
+    questions, committing the whole object graph at once.
+    """
+    session = InterviewSession(
+        user=user,
+        role="Software Engineer",
+        difficulty="Medium",
+        status=SessionStatus.IN_PROGRESS,
+        question_count=question_count,
+        start_time=datetime.utcnow()
+    )
+    session.session_questions = [
+        SessionQuestion(
+            question=Question(
+                question_text=f"Test question {idx}",
                 category="Technical",
                 difficulty="Medium",
                 role="Software Engineer",
                 expected_answer_points=["Point 1", "Point 2", "Point 3"],
                 time_limit_seconds=300
-            )
-            db.add(question)
-            questions.append(question)
-        db.commit()
-        
-        # Create interview session
-        session = InterviewSession(
-            user_id=user.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.IN_PROGRESS,
-            question_count=3,
-            start_time=datetime.utcnow()
+            ),
+            display_order=idx,
+            status='pending'
         )
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        # Create session questions
-        for idx, question in enumerate(questions, start=1):
-            sq = SessionQuestion(
-                session_id=session.id,
-                question_id=question.id,
-                display_order=idx,
-                status='pending'
-            )
-            db.add(sq)
-        db.commit()
+        for idx in range(1, question_count + 1)
+    ]
+    db.add(session)
+    db.commit()
+    return session
+
+
+class TestQuestionDisplayEndpoint:
+    """Test question display endpoint"""
+    
+    def test_get_question_success(self, client: TestClient, db: Session):
+        """Test successful question retrieval"""
+        user = _make_user()
+        session = _seed_session(db, user, question_count=3)
         
         # Create access token
         token = create_access_token(user_id=user.id, email=user.email)
@@ -120,26 +97,18 @@ class TestQuestionDisplayEndpoint:
         ).first()
         assert sq.question_displayed_at is not None
     
-    def test_get_question_without_auth(self, db: Session):
+    def test_get_question_without_auth(self, client: TestClient, db: Session):
         """Test question retrieval without authentication"""
         response = client.get("/api/v1/interviews/1/questions/1")
         
         # Auth middleware returns 403 when no token provided
         assert response.status_code == 403
     
-    def test_get_question_session_not_found(self, db: Session):
+    def test_get_question_session_not_found(self, client: TestClient, db: Session):
         """Test question retrieval with non-existent session"""
-        # Create user
-        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user = User(
-            email=unique_email,
-            password_hash="hashed_password",
-            name="Test User",
-            account_status=AccountStatus.ACTIVE
-        )
+        user = _make_user()
         db.add(user)
         db.commit()
-        db.refresh(user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -151,66 +120,12 @@ class TestQuestionDisplayEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_get_question_wrong_user(self, db: Session):
+    def test_get_question_wrong_user(self, client: TestClient, db: Session):
         """Test question retrieval from another user's session"""
-        # Create first user and session
-        user1_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user1 = User(
-            email=user1_email,
-            password_hash="hashed_password",
-            name="User 1",
-            account_status=AccountStatus.ACTIVE
-        )
-        db.add(user1)
-        db.commit()
-        db.refresh(user1)
-        
-        # Create question
-        question = Question(
-            question_text="Test question",
-            category="Technical",
-            difficulty="Medium",
-            role="Software Engineer",
-            expected_answer_points=["Point 1", "Point 2", "Point 3"],
-            time_limit_seconds=300
-        )
-        db.add(question)
-        db.commit()
-        
-        # Create session for user1
-        session = InterviewSession(
-            user_id=user1.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.IN_PROGRESS,
-            question_count=1,
-            start_time=datetime.utcnow()
-        )
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        # Create session question
-        sq = SessionQuestion(
-            session_id=session.id,
-            question_id=question.id,
-            display_order=1,
-            status='pending'
-        )
-        db.add(sq)
-        db.commit()
-        
-        # Create second user
-        user2_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user2 = User(
-            email=user2_email,
-            password_hash="hashed_password",
-            name="User 2",
-            account_status=AccountStatus.ACTIVE
-        )
+        # Create a session for user1 and a second user in one commit
+        user2 = _make_user("User 2")
         db.add(user2)
-        db.commit()
-        db.refresh(user2)
+        session = _seed_session(db, _make_user("User 1"))
         
         # Try to access user1's session with user2's token
         token = create_access_token(user_id=user2.id, email=user2.email)
@@ -223,54 +138,27 @@ class TestQuestionDisplayEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_get_question_invalid_question_number(self, db: Session):
-        """Test question retrieval with invalid question number"""
-        # Create user
-        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user = User(
-            email=unique_email,
-            password_hash="hashed_password",
-            name="Test User",
-            account_status=AccountStatus.ACTIVE
-        )
-        db.add(user)
+    def test_get_question_deleted_session(self, client: TestClient, db: Session):
+        """Test question retrieval from a soft-deleted session"""
+        user = _make_user()
+        session = _seed_session(db, user)
+        session.deleted_at = datetime.utcnow()
         db.commit()
-        db.refresh(user)
         
-        # Create question
-        question = Question(
-            question_text="Test question",
-            category="Technical",
-            difficulty="Medium",
-            role="Software Engineer",
-            expected_answer_points=["Point 1", "Point 2", "Point 3"],
-            time_limit_seconds=300
-        )
-        db.add(question)
-        db.commit()
+        token = create_access_token(user_id=user.id, email=user.email)
         
-        # Create session
-        session = InterviewSession(
-            user_id=user.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.IN_PROGRESS,
-            question_count=1,
-            start_time=datetime.utcnow()
+        response = client.get(
+            f"/api/v1/interviews/{session.id}/questions/1",
+            headers={"Authorization": f"Bearer {token}"}
         )
-        db.add(session)
-        db.commit()
-        db.refresh(session)
         
-        # Create session question
-        sq = SessionQuestion(
-            session_id=session.id,
-            question_id=question.id,
-            display_order=1,
-            status='pending'
-        )
-        db.add(sq)
-        db.commit()
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
+    
+    def test_get_question_invalid_question_number(self, client: TestClient, db: Session):
+        """Test question retrieval with invalid question number"""
+        user = _make_user()
+        session = _seed_session(db, user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
@@ -283,54 +171,10 @@ class TestQuestionDisplayEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
-    def test_get_question_timestamp_recorded_once(self, db: Session):
+    def test_get_question_timestamp_recorded_once(self, client: TestClient, db: Session):
         """Test that question_displayed_at is only recorded on first view"""
-        # Create user
-        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
-        user = User(
-            email=unique_email,
-            password_hash="hashed_password",
-            name="Test User",
-            account_status=AccountStatus.ACTIVE
-        )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        
-        # Create question
-        question = Question(
-            question_text="Test question",
-            category="Technical",
-            difficulty="Medium",
-            role="Software Engineer",
-            expected_answer_points=["Point 1", "Point 2", "Point 3"],
-            time_limit_seconds=300
-        )
-        db.add(question)
-        db.commit()
-        
-        # Create session
-        session = InterviewSession(
-            user_id=user.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.IN_PROGRESS,
-            question_count=1,
-            start_time=datetime.utcnow()
-        )
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-        
-        # Create session question
-        sq = SessionQuestion(
-            session_id=session.id,
-            question_id=question.id,
-            display_order=1,
-            status='pending'
-        )
-        db.add(sq)
-        db.commit()
+        user = _make_user()
+        session = _seed_session(db, user)
         
         token = create_access_token(user_id=user.id, email=user.email)
         
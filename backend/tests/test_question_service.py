@@ -13,6 +13,12 @@ from app.models.question import Question
 from app.services.cache_service import CacheService
 
 
+@pytest.fixture
+def service(mocker) -> QuestionService:
+    """QuestionService on a mocked session and cache, for tests that never reach the database."""
+    return QuestionService(mocker.Mock(spec=Session), cache=mocker.Mock(spec=CacheService))
+
+
 class TestQuestionService:
     """Test suite for QuestionService"""
     
@@ -122,14 +128,12 @@ class TestQuestionService:
         # Verify result was cached
         mock_cache.set.assert_called_once()
     
-    def test_validate_question_success(self, db: Session):
+    def test_validate_question_success(self, service: QuestionService):
         """
         Test question validation with valid question.
         
         Requirements: 13.1-13.10
         """
-        service = QuestionService(db)
-        
         valid_question = {
             'question_text': 'Describe a time when you had to debug a complex issue',
             'category': 'Behavioral',
@@ -140,14 +144,12 @@ class TestQuestionService:
         
         assert service._validate_question(valid_question) is True
     
-    def test_validate_question_missing_field(self, db: Session):
+    def test_validate_question_missing_field(self, service: QuestionService):
         """
         Test question validation fails with missing field.
         
         Requirements: 13.2
         """
-        service = QuestionService(db)
-        
         invalid_question = {
             'question_text': 'What is your experience?',
             'category': 'Technical',
@@ -156,14 +158,12 @@ class TestQuestionService:
         
         assert service._validate_question(invalid_question) is False
     
-    def test_validate_question_text_too_short(self, db: Session):
+    def test_validate_question_text_too_short(self, service: QuestionService):
         """
         Test question validation fails with short question text.
         
         Requirements: 13.3
         """
-        service = QuestionService(db)
-        
         invalid_question = {
             'question_text': 'Short',  # Less than 10 characters
             'category': 'Technical',
@@ -174,14 +174,12 @@ class TestQuestionService:
         
         assert service._validate_question(invalid_question) is False
     
-    def test_validate_question_invalid_category(self, db: Session):
+    def test_validate_question_invalid_category(self, service: QuestionService):
         """
         Test question validation fails with invalid category.
         
         Requirements: 13.5
         """
-        service = QuestionService(db)
-        
         invalid_question = {
             'question_text': 'What is your experience with Python programming?',
             'category': 'InvalidCategory',  # Not in VALID_CATEGORIES
@@ -192,14 +190,12 @@ class TestQuestionService:
         
         assert service._validate_question(invalid_question) is False
     
-    def test_validate_question_insufficient_answer_points(self, db: Session):
+    def test_validate_question_insufficient_answer_points(self, service: QuestionService):
         """
         Test question validation fails with insufficient answer points.
         
         Requirements: 13.6
         """
-        service = QuestionService(db)
-        
         invalid_question = {
             'question_text': 'What is your experience with Python programming?',
             'category': 'Technical',
@@ -210,14 +206,12 @@ class TestQuestionService:
         
         assert service._validate_question(invalid_question) is False
     
-    def test_validate_question_invalid_time_limit(self, db: Session):
+    def test_validate_question_invalid_time_limit(self, service: QuestionService):
         """
         Test question validation fails with invalid time limit.
         
         Requirements: 13.7
         """
-        service = QuestionService(db)
-        
         invalid_question = {
             'question_text': 'What is your experience with Python programming?',
             'category': 'Technical',
@@ -228,14 +222,28 @@ class TestQuestionService:
         
         assert service._validate_question(invalid_question) is False
     
-    def test_construct_cache_key_consistent(self, db: Session):
+    def test_validate_question_inappropriate_content(self, service: QuestionService):
+        """
+        Test question validation fails when the text contains profanity.
+        
+        Requirements: 13.1-13.10
+        """
+        invalid_question = {
+            'question_text': 'What DAMN bug took you longest to fix?',
+            'category': 'Technical',
+            'difficulty': 'Medium',
+            'expected_answer_points': ['Point 1', 'Point 2', 'Point 3'],
+            'time_limit_seconds': 300
+        }
+        
+        assert service._validate_question(invalid_question) is False
+    
+    def test_construct_cache_key_consistent(self, service: QuestionService):
         """
         Test that cache key construction is consistent.
         
         Requirements: 12.1
         """
-        service = QuestionService(db)
-        
         key1 = service._construct_cache_key('Software Engineer', 'Medium', 5, ['Technical', 'Behavioral'])
         key2 = service._construct_cache_key('Software Engineer', 'Medium', 5, ['Behavioral', 'Technical'])
         
@@ -245,33 +253,27 @@ class TestQuestionService:
         assert 'medium' in key1
         assert '5' in key1
     
-    def test_generate_validates_difficulty(self, db: Session):
+    def test_generate_validates_difficulty(self, service: QuestionService):
         """
         Test that generate() validates difficulty parameter.
         """
-        service = QuestionService(db)
-        
         with pytest.raises(ValueError, match="Invalid difficulty"):
             service.generate('Software Engineer', 'InvalidDifficulty', 1)
     
-    def test_generate_validates_question_count(self, db: Session):
+    def test_generate_validates_question_count(self, service: QuestionService):
         """
         Test that generate() validates question_count parameter.
         """
-        service = QuestionService(db)
-        
         with pytest.raises(ValueError, match="question_count must be between 1 and 20"):
             service.generate('Software Engineer', 'Medium', 0)
         
         with pytest.raises(ValueError, match="question_count must be between 1 and 20"):
             service.generate('Software Engineer', 'Medium', 25)
     
-    def test_generate_validates_categories(self, db: Session):
+    def test_generate_validates_categories(self, service: QuestionService):
         """
         Test that generate() validates categories parameter.
         """
-        service = QuestionService(db)
-        
         with pytest.raises(ValueError, match="Invalid categories"):
             service.generate('Software Engineer', 'Medium', 1, categories=['InvalidCategory'])
     
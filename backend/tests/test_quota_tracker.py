@@ -3,13 +3,50 @@ Tests for QuotaTracker
 
 Requirements: 26.1-26.11
 """
+import logging
+
 import pytest
 from datetime import date, datetime
+from freezegun import freeze_time
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.services.ai.quota_tracker import QuotaTracker, PROVIDER_QUOTAS
 from app.models.ai_provider_usage import AIProviderUsage
 
+# groq_1 usage levels shared by the tests
+GROQ1_QUOTA = PROVIDER_QUOTAS['groq_1']
+USAGE_50 = GROQ1_QUOTA // 2
+USAGE_85 = int(GROQ1_QUOTA * 0.85)
+USAGE_95 = int(GROQ1_QUOTA * 0.95)
+
+# Usage is tracked per calendar day; pin the day so a run that crosses
+# midnight cannot split one test's usage across two rows
+FIXED_DATE = date(2026, 2, 12)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _frozen_day():
+    with freeze_time(FIXED_DATE):
+        yield
+
+
+def _record_usage_bulk(db: Session, character_counts: dict) -> None:
+    """Seed today's usage for several providers in one INSERT and commit."""
+    now = datetime.utcnow()
+    db.execute(insert(AIProviderUsage), [
+        {
+            'provider_name': provider_name,
+            'date': FIXED_DATE,
+            'request_count': 1,
+            'character_count': character_count,
+            'created_at': now,
+            'updated_at': now
+        }
+        for provider_name, character_count in character_counts.items()
+    ])
+    db.commit()
+
 
 class TestQuotaTracker:
     """Test suite for QuotaTracker functionality"""
@@ -28,7 +65,7 @@ class TestQuotaTracker:
         # Verify record created
         usage = db.query(AIProviderUsage).filter(
             AIProviderUsage.provider_name == 'groq_1',
-            AIProviderUsage.date == date.today()
+            AIProviderUsage.date == FIXED_DATE
         ).first()
         
         assert usage is not None
@@ -51,20 +88,15 @@ class TestQuotaTracker:
         tracker.record_usage('groq_1', character_count=500, request_count=1)
         
         # Verify record updated (not duplicated)
-        usage = db.query(AIProviderUsage).filter(
+        rows = db.query(AIProviderUsage).filter(
             AIProviderUsage.provider_name == 'groq_1',
-            AIProviderUsage.date == date.today()
-        ).first()
+            AIProviderUsage.date == FIXED_DATE
+        ).all()
         
+        assert len(rows) == 1
+        usage = rows[0]
         assert usage.character_count == 1500  # 1000 + 500
         assert usage.request_count == 2       # 1 + 1
-        
-        # Verify only one record exists
-        count = db.query(AIProviderUsage).filter(
-            AIProviderUsage.provider_name == 'groq_1',
-            AIProviderUsage.date == date.today()
-        ).count()
-        assert count == 1
     
     def test_get_remaining_percentage_no_usage(self, db: Session):
         """
@@ -79,52 +111,29 @@ class TestQuotaTracker:
         
         assert remaining == 1.0  # 100% remaining
     
-    def test_get_remaining_percentage_partial_usage(self, db: Session):
-        """
-        Test remaining percentage with partial usage.
-        
-        Requirements: 26.4, 26.5
-        """
-        tracker = QuotaTracker(db)
-        
-        # Use 50% of quota (14400 / 2 = 7200)
-        tracker.record_usage('groq_1', character_count=7200)
-        
-        remaining = tracker.get_remaining_percentage('groq_1')
-        
-        assert remaining == pytest.approx(0.5, rel=0.01)  # 50% remaining
-    
-    def test_get_remaining_percentage_full_usage(self, db: Session):
-        """
-        Test remaining percentage when quota is exhausted.
-        
-        Requirements: 26.4, 26.5, 26.11
-        """
-        tracker = QuotaTracker(db)
-        
-        # Use 100% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=quota_limit)
-        
-        remaining = tracker.get_remaining_percentage('groq_1')
-        
-        assert remaining == 0.0  # 0% remaining
-    
-    def test_get_remaining_percentage_over_quota(self, db: Session):
+    @pytest.mark.parametrize("usage_fraction,expected_status,expected_remaining", [
+        (0.5, 'available', 0.5),
+        (0.85, 'warning', 0.15),
+        (0.95, 'critical', 0.05),
+        (1.0, 'disabled', 0.0),
+        (1.2, 'disabled', 0.0),  # Capped at 0%
+    ])
+    def test_usage_thresholds(self, db: Session, usage_fraction, expected_status, expected_remaining):
         """
-        Test remaining percentage when usage exceeds quota.
+        Test remaining percentage and status across quota thresholds.
         
-        Requirements: 26.4, 26.5, 26.11
+        Requirements: 26.4, 26.5, 26.8-26.11
         """
         tracker = QuotaTracker(db)
         
-        # Use 120% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=int(quota_limit * 1.2))
+        tracker.record_usage('groq_1', character_count=int(GROQ1_QUOTA * usage_fraction))
         
         remaining = tracker.get_remaining_percentage('groq_1')
+        stats = tracker.get_usage_stats('groq_1')
         
-        assert remaining == 0.0  # Capped at 0%
+        assert remaining == pytest.approx(expected_remaining)
+        assert stats['remaining_percentage'] == remaining
+        assert stats['status'] == expected_status
     
     def test_is_provider_available_with_quota(self, db: Session):
         """
@@ -135,7 +144,7 @@ class TestQuotaTracker:
         tracker = QuotaTracker(db)
         
         # Use 50% of quota
-        tracker.record_usage('groq_1', character_count=7200)
+        tracker.record_usage('groq_1', character_count=USAGE_50)
         
         assert tracker.is_provider_available('groq_1') is True
     
@@ -148,8 +157,7 @@ class TestQuotaTracker:
         tracker = QuotaTracker(db)
         
         # Use 100% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=quota_limit)
+        tracker.record_usage('groq_1', character_count=GROQ1_QUOTA)
         
         assert tracker.is_provider_available('groq_1') is False
     
@@ -178,67 +186,16 @@ class TestQuotaTracker:
         tracker = QuotaTracker(db)
         
         # Use 50% of quota
-        tracker.record_usage('groq_1', character_count=7200, request_count=10)
+        tracker.record_usage('groq_1', character_count=USAGE_50, request_count=10)
         
         stats = tracker.get_usage_stats('groq_1')
         
         assert stats['provider_name'] == 'groq_1'
         assert stats['request_count'] == 10
-        assert stats['character_count'] == 7200
+        assert stats['character_count'] == USAGE_50
         assert stats['remaining_percentage'] == pytest.approx(0.5, rel=0.01)
         assert stats['status'] == 'available'
     
-    def test_get_usage_stats_warning_threshold(self, db: Session):
-        """
-        Test usage stats at warning threshold (80%).
-        
-        Requirements: 26.8, 26.9
-        """
-        tracker = QuotaTracker(db)
-        
-        # Use 85% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=int(quota_limit * 0.85))
-        
-        stats = tracker.get_usage_stats('groq_1')
-        
-        assert stats['status'] == 'warning'
-        assert stats['remaining_percentage'] < 0.20
-    
-    def test_get_usage_stats_critical_threshold(self, db: Session):
-        """
-        Test usage stats at critical threshold (90%).
-        
-        Requirements: 26.9, 26.10
-        """
-        tracker = QuotaTracker(db)
-        
-        # Use 95% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=int(quota_limit * 0.95))
-        
-        stats = tracker.get_usage_stats('groq_1')
-        
-        assert stats['status'] == 'critical'
-        assert stats['remaining_percentage'] < 0.10
-    
-    def test_get_usage_stats_disabled_threshold(self, db: Session):
-        """
-        Test usage stats when quota exhausted (100%).
-        
-        Requirements: 26.10, 26.11
-        """
-        tracker = QuotaTracker(db)
-        
-        # Use 100% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=quota_limit)
-        
-        stats = tracker.get_usage_stats('groq_1')
-        
-        assert stats['status'] == 'disabled'
-        assert stats['remaining_percentage'] == 0.0
-    
     def test_get_all_provider_stats(self, db: Session):
         """
         Test getting stats for all providers.
@@ -248,9 +205,7 @@ class TestQuotaTracker:
         tracker = QuotaTracker(db)
         
         # Record usage for multiple providers
-        tracker.record_usage('groq_1', character_count=1000)
-        tracker.record_usage('groq_2', character_count=2000)
-        tracker.record_usage('huggingface_1', character_count=5000)
+        _record_usage_bulk(db, {'groq_1': 1000, 'groq_2': 2000, 'huggingface_1': 5000})
         
         all_stats = tracker.get_all_provider_stats()
         
@@ -282,49 +237,45 @@ class TestQuotaTracker:
         remaining_groq_2 = tracker.get_remaining_percentage('groq_2')
         assert remaining_groq_2 == 1.0
     
-    def test_reset_daily_usage_specific_provider(self, db: Session):
+    @pytest.mark.parametrize("provider_name,expected_remaining_usage", [
+        ('groq_1', {'groq_2': 3000, 'huggingface_1': 10000}),  # Specific provider
+        (None, {}),  # All providers
+    ])
+    def test_reset_daily_usage(self, db: Session, provider_name, expected_remaining_usage):
         """
-        Test resetting usage for specific provider.
+        Test resetting usage for one provider or for all providers.
         """
         tracker = QuotaTracker(db)
         
         # Record usage for multiple providers
-        tracker.record_usage('groq_1', character_count=5000)
-        tracker.record_usage('groq_2', character_count=3000)
+        _record_usage_bulk(db, {'groq_1': 5000, 'groq_2': 3000, 'huggingface_1': 10000})
         
-        # Reset groq_1 only
-        tracker.reset_daily_usage('groq_1')
-        
-        # Verify groq_1 reset
-        assert tracker.get_remaining_percentage('groq_1') == 1.0
+        tracker.reset_daily_usage(provider_name)
         
-        # Verify groq_2 unchanged
-        remaining_groq_2 = tracker.get_remaining_percentage('groq_2')
-        assert remaining_groq_2 < 1.0
-    
-    def test_reset_daily_usage_all_providers(self, db: Session):
-        """
-        Test resetting usage for all providers.
-        """
-        tracker = QuotaTracker(db)
-        
-        # Record usage for multiple providers
-        tracker.record_usage('groq_1', character_count=5000)
-        tracker.record_usage('groq_2', character_count=3000)
-        tracker.record_usage('huggingface_1', character_count=10000)
-        
-        # Reset all
-        tracker.reset_daily_usage()
-        
-        # Verify all reset
-        assert tracker.get_remaining_percentage('groq_1') == 1.0
-        assert tracker.get_remaining_percentage('groq_2') == 1.0
-        assert tracker.get_remaining_percentage('huggingface_1') == 1.0
+        # Verify every provider's remaining usage in one query
+        remaining_usage = dict(
+            db.query(AIProviderUsage.provider_name, AIProviderUsage.character_count).filter(
+                AIProviderUsage.date == FIXED_DATE
+            ).all()
+        )
+        assert remaining_usage == expected_remaining_usage
 
 
 class TestQuotaTrackerAlerts:
     """Test suite for quota alert functionality"""
     
+    @pytest.fixture(autouse=True)
+    def _capture_alerts(self, caplog):
+        """Capture only the tracker's alerts, not its per-call INFO records."""
+        caplog.set_level(logging.WARNING, logger='app.services.ai.quota_tracker')
+    
+    @staticmethod
+    def _alerted(caplog, level: str, text: str) -> bool:
+        return any(
+            record.levelname == level and text in record.getMessage()
+            for record in caplog.records
+        )
+    
     def test_alert_at_80_percent(self, db: Session, caplog):
         """
         Test that warning alert is logged at 80% usage.
@@ -334,13 +285,9 @@ class TestQuotaTrackerAlerts:
         tracker = QuotaTracker(db)
         
         # Use 85% of quota to trigger warning
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=int(quota_limit * 0.85))
+        tracker.record_usage('groq_1', character_count=USAGE_85)
         
-        # Check logs for warning
-        assert 'WARNING' in caplog.text
-        assert 'groq_1' in caplog.text
-        assert '80%' in caplog.text or 'warning' in caplog.text.lower()
+        assert self._alerted(caplog, 'WARNING', 'WARNING: groq_1 at 80%')
     
     def test_alert_at_90_percent(self, db: Session, caplog):
         """
@@ -351,13 +298,9 @@ class TestQuotaTrackerAlerts:
         tracker = QuotaTracker(db)
         
         # Use 95% of quota to trigger critical
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=int(quota_limit * 0.95))
+        tracker.record_usage('groq_1', character_count=USAGE_95)
         
-        # Check logs for critical warning
-        assert 'CRITICAL' in caplog.text or 'WARNING' in caplog.text
-        assert 'groq_1' in caplog.text
-        assert '90%' in caplog.text or 'critical' in caplog.text.lower()
+        assert self._alerted(caplog, 'WARNING', 'CRITICAL: groq_1 at 90%')
     
     def test_alert_at_100_percent(self, db: Session, caplog):
         """
@@ -368,12 +311,9 @@ class TestQuotaTrackerAlerts:
         tracker = QuotaTracker(db)
         
         # Use 100% of quota
-        quota_limit = PROVIDER_QUOTAS['groq_1']
-        tracker.record_usage('groq_1', character_count=quota_limit)
+        tracker.record_usage('groq_1', character_count=GROQ1_QUOTA)
         
-        # Check logs for error - actual message is "QUOTA EXCEEDED"
-        assert 'QUOTA EXCEEDED' in caplog.text or 'ERROR' in caplog.text
-        assert 'groq_1' in caplog.text
+        assert self._alerted(caplog, 'ERROR', 'QUOTA EXCEEDED: groq_1')
 
 
 class TestQuotaTrackerEdgeCases:
@@ -397,15 +337,10 @@ class TestQuotaTrackerEdgeCases:
         assert remaining == 1.0
     
     def test_negative_character_count_prevented(self, db: Session):
-        """Test that negative character counts are handled"""
+        """Test that negative character counts are rejected without recording usage"""
         tracker = QuotaTracker(db)
         
-        # This should not cause issues (implementation should handle gracefully)
-        try:
+        with pytest.raises(ValueError, match="character_count must be non-negative"):
             tracker.record_usage('groq_1', character_count=-100)
-            # If it doesn't raise, verify it doesn't break quota calculation
-            remaining = tracker.get_remaining_percentage('groq_1')
-            assert 0.0 <= remaining <= 1.0
-        except ValueError:
-            # It's also acceptable to raise an error
-            pass
+        
+        assert tracker.get_remaining_percentage('groq_1') == 1.0
@@ -3,47 +3,105 @@ Tests for Resume Agent Service
 
 Requirements: 27.1-27.13
 """
+import copy
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from sqlalchemy.orm import Session
 
 from app.services.agents.resume_agent_service import ResumeAgentService
-from app.models.resume import Resume, ResumeStatus
-from app.models.resume_analysis import ResumeAnalysis
+from app.models.resume import ResumeStatus
 
+# Keep this module's shared fixtures on one worker under `pytest -n auto`
+pytestmark = pytest.mark.xdist_group("resume_analysis")
 
-@pytest.fixture
+
+def _stub_first(db, obj):
+    """Make db.query(...).filter(...).first() return obj"""
+    db.query.return_value.filter.return_value.first.return_value = obj
+
+
+def _stub_order_first(db, obj):
+    """Make db.query(...).filter(...).order_by(...).first() return obj"""
+    db.query.return_value.filter.return_value.order_by.return_value.first.return_value = obj
+
+
+def _stub_order_limit_all(db, seq):
+    """Make db.query(...).filter(...).order_by(...).limit(...).all() return seq"""
+    db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = seq
+
+
+@pytest.fixture(scope="module")
 def mock_db():
-    """Mock database session"""
+    """Mock database session, shared across the module"""
     return Mock(spec=Session)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_db(mock_db):
+    """Clear configured returns and side effects on the shared session after each test"""
+    yield
+    mock_db.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
 def service(mock_db):
-    """Resume agent service instance"""
+    """Resume agent service instance (stateless apart from its session)"""
     return ResumeAgentService(mock_db)
 
 
+@pytest.fixture(scope="module")
+def resume_template():
+    """Prebuilt resume stand-in; plain attributes avoid Mock(spec=Resume) introspection"""
+    return SimpleNamespace(
+        id=1,
+        user_id=1,
+        filename="test.pdf",
+        extracted_text="Test resume with Python and JavaScript skills",
+        skills={
+            'technical_skills': ['Python', 'JavaScript'],
+            'soft_skills': ['Leadership']
+        },
+        experience={'entries': []},
+        education={'entries': []},
+        status=ResumeStatus.SKILLS_EXTRACTED.value,
+        total_experience_months=60,
+        seniority_level='Mid',
+        deleted_at=None
+    )
+
+
 @pytest.fixture
-def mock_resume():
+def mock_resume(resume_template):
     """Mock resume object"""
-    resume = Mock(spec=Resume)
-    resume.id = 1
-    resume.user_id = 1
-    resume.filename = "test.pdf"
-    resume.extracted_text = "Test resume with Python and JavaScript skills"
-    resume.skills = {
-        'technical_skills': ['Python', 'JavaScript'],
-        'soft_skills': ['Leadership']
-    }
-    resume.experience = {'entries': []}
-    resume.education = {'entries': []}
-    resume.status = ResumeStatus.SKILLS_EXTRACTED.value
-    resume.total_experience_months = 60
-    resume.seniority_level = 'Mid'
-    resume.deleted_at = None
-    return resume
+    return copy.deepcopy(resume_template)
+
+
+@pytest.fixture(scope="module")
+def analysis_template():
+    """Prebuilt resume analysis stand-in shared by the analysis tests"""
+    return SimpleNamespace(
+        id=1,
+        resume_id=1,
+        analysis_data={},
+        agent_reasoning=[],
+        has_reasoning=False,
+        execution_time_ms=0,
+        status='success',
+        created_at=datetime.utcnow(),
+        deleted_at=None
+    )
+
+
+@pytest.fixture
+def make_analysis(analysis_template):
+    """Factory for mock analysis objects with per-test overrides"""
+    def _make(**overrides):
+        analysis = copy.deepcopy(analysis_template)
+        analysis.__dict__.update(overrides)
+        return analysis
+    return _make
 
 
 class TestResumeValidation:
@@ -51,56 +109,38 @@ class TestResumeValidation:
     
     def test_validate_existing_resume(self, service, mock_db, mock_resume):
         """Test validation of existing resume"""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
+        _stub_first(mock_db, mock_resume)
         
         result = service._validate_resume(1, 1)
         
         assert result == mock_resume
     
-    def test_validate_nonexistent_resume(self, service, mock_db):
-        """Test validation fails for nonexistent resume"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
-        
-        with pytest.raises(ValueError, match="not found"):
-            service._validate_resume(999, 1)
-    
-    def test_validate_wrong_user(self, service, mock_db):
-        """Test validation fails for wrong user"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
-        
-        with pytest.raises(ValueError, match="not found"):
-            service._validate_resume(1, 999)
-    
-    def test_validate_resume_not_ready(self, service, mock_db, mock_resume):
-        """Test validation fails if resume not ready"""
-        mock_resume.status = ResumeStatus.UPLOADED.value
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
-        
-        with pytest.raises(ValueError, match="not ready"):
-            service._validate_resume(1, 1)
-    
-    def test_validate_resume_no_text(self, service, mock_db, mock_resume):
-        """Test validation fails if no extracted text"""
-        mock_resume.extracted_text = None
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
-        
-        with pytest.raises(ValueError, match="no extracted text"):
-            service._validate_resume(1, 1)
+    @pytest.mark.parametrize("resume_id,user_id,resume_overrides,error", [
+        (999, 1, None, "not found"),  # Nonexistent resume
+        (1, 999, None, "not found"),  # Wrong user
+        (1, 1, {'status': ResumeStatus.UPLOADED.value}, "not ready"),
+        (1, 1, {'extracted_text': None}, "no extracted text"),
+    ])
+    def test_validate_invalid_resume(self, service, mock_db, mock_resume, resume_id, user_id, resume_overrides, error):
+        """Test validation fails for missing, foreign, unready or empty resumes"""
+        if resume_overrides is None:
+            _stub_first(mock_db, None)
+        else:
+            mock_resume.__dict__.update(resume_overrides)
+            _stub_first(mock_db, mock_resume)
+        
+        with pytest.raises(ValueError, match=error):
+            service._validate_resume(resume_id, user_id)
 
 
 class TestCaching:
     """Test caching logic (Req 27.2, 27.3)"""
     
-    def test_get_cached_analysis_recent(self, service, mock_db):
+    def test_get_cached_analysis_recent(self, service, mock_db, make_analysis):
         """Test getting recent cached analysis"""
-        mock_analysis = Mock(spec=ResumeAnalysis)
-        mock_analysis.id = 1
-        mock_analysis.resume_id = 1
-        mock_analysis.status = 'success'
-        mock_analysis.created_at = datetime.utcnow() - timedelta(days=10)
-        mock_analysis.deleted_at = None
+        mock_analysis = make_analysis(created_at=datetime.utcnow() - timedelta(days=10))
         
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_analysis
+        _stub_order_first(mock_db, mock_analysis)
         
         result = service._get_cached_analysis(1)
         
@@ -108,10 +148,7 @@ class TestCaching:
     
     def test_get_cached_analysis_expired(self, service, mock_db):
         """Test expired cache returns None"""
-        mock_analysis = Mock(spec=ResumeAnalysis)
-        mock_analysis.created_at = datetime.utcnow() - timedelta(days=31)
-        
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+        _stub_order_first(mock_db, None)
         
         result = service._get_cached_analysis(1)
         
@@ -147,7 +184,7 @@ class TestFallbackAnalysis:
 class TestAnalysisStorage:
     """Test analysis storage (Req 27.9)"""
     
-    def test_store_analysis(self, service, mock_db):
+    def test_store_analysis(self, service, mock_db, make_analysis):
         """Test storing analysis in database"""
         analysis_data = {
             'skill_inventory': {},
@@ -156,8 +193,7 @@ class TestAnalysisStorage:
             'improvement_roadmap': {}
         }
         
-        mock_analysis = Mock(spec=ResumeAnalysis)
-        mock_analysis.id = 1
+        mock_analysis = make_analysis()
         mock_db.add = Mock()
         mock_db.commit = Mock()
         mock_db.refresh = Mock(side_effect=lambda x: setattr(x, 'id', 1))
@@ -180,17 +216,15 @@ class TestAnalysisStorage:
 class TestAnalysisFormatting:
     """Test analysis response formatting (Req 27.10)"""
     
-    def test_format_analysis_response(self, service):
+    def test_format_analysis_response(self, service, make_analysis):
         """Test formatting analysis for API response"""
-        mock_analysis = Mock(spec=ResumeAnalysis)
-        mock_analysis.id = 1
-        mock_analysis.resume_id = 1
-        mock_analysis.analysis_data = {'test': 'data'}
-        mock_analysis.agent_reasoning = [{'step': 1}]
-        mock_analysis.has_reasoning = True
-        mock_analysis.execution_time_ms = 15000
-        mock_analysis.status = 'success'
-        mock_analysis.created_at = datetime.utcnow()
+        mock_analysis = make_analysis(
+            analysis_data={'test': 'data'},
+            agent_reasoning=[{'step': 1}],
+            has_reasoning=True,
+            execution_time_ms=15000,
+            created_at=datetime.utcnow()
+        )
         
         result = service._format_analysis_response(mock_analysis, from_cache=True)
         
@@ -201,17 +235,9 @@ class TestAnalysisFormatting:
         assert result['from_cache'] is True
         assert 'analyzed_at' in result
     
-    def test_format_without_reasoning(self, service):
+    def test_format_without_reasoning(self, service, make_analysis):
         """Test formatting when no reasoning available"""
-        mock_analysis = Mock(spec=ResumeAnalysis)
-        mock_analysis.id = 1
-        mock_analysis.resume_id = 1
-        mock_analysis.analysis_data = {}
-        mock_analysis.agent_reasoning = []
-        mock_analysis.has_reasoning = False
-        mock_analysis.execution_time_ms = 0
-        mock_analysis.status = 'fallback'
-        mock_analysis.created_at = datetime.utcnow()
+        mock_analysis = make_analysis(status='fallback', created_at=datetime.utcnow())
         
         result = service._format_analysis_response(mock_analysis, from_cache=False)
         
@@ -221,23 +247,16 @@ class TestAnalysisFormatting:
 class TestAnalysisHistory:
     """Test analysis history retrieval"""
     
-    def test_get_analysis_history(self, service, mock_db, mock_resume):
+    def test_get_analysis_history(self, service, mock_db, mock_resume, make_analysis):
         """Test getting analysis history"""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
+        _stub_first(mock_db, mock_resume)
         
         mock_analyses = [
-            Mock(spec=ResumeAnalysis, id=1, resume_id=1, created_at=datetime.utcnow()),
-            Mock(spec=ResumeAnalysis, id=2, resume_id=1, created_at=datetime.utcnow())
+            make_analysis(id=1, created_at=datetime.utcnow()),
+            make_analysis(id=2, created_at=datetime.utcnow())
         ]
         
-        for analysis in mock_analyses:
-            analysis.analysis_data = {}
-            analysis.agent_reasoning = []
-            analysis.has_reasoning = False
-            analysis.execution_time_ms = 0
-            analysis.status = 'success'
-        
-        mock_db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = mock_analyses
+        _stub_order_limit_all(mock_db, mock_analyses)
         
         result = service.get_analysis_history(1, 1, limit=10)
         
@@ -245,7 +264,7 @@ class TestAnalysisHistory:
     
     def test_get_history_wrong_user(self, service, mock_db):
         """Test history fails for wrong user"""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        _stub_first(mock_db, None)
         
         with pytest.raises(ValueError, match="not found"):
             service.get_analysis_history(1, 999)
@@ -254,24 +273,37 @@ class TestAnalysisHistory:
 class TestFullAnalysisFlow:
     """Test complete analysis flow"""
     
-    @patch('app.services.agents.resume_agent_service.ResumeIntelligenceAgent')
-    @patch('app.services.agents.resume_agent_service.AgentExecutor')
-    def test_analyze_resume_with_cache_hit(self, mock_executor_class, mock_agent_class, service, mock_db, mock_resume):
+    @pytest.fixture(scope="class")
+    def agent_patches(self):
+        """Patch the agent and executor once for the class"""
+        with patch.multiple(
+            'app.services.agents.resume_agent_service',
+            ResumeIntelligenceAgent=DEFAULT,
+            AgentExecutor=DEFAULT
+        ) as mocks:
+            yield SimpleNamespace(
+                agent=mocks['ResumeIntelligenceAgent'],
+                executor=mocks['AgentExecutor']
+            )
+    
+    @pytest.fixture(autouse=True)
+    def _reset_agent_patches(self, agent_patches):
+        """Clear recorded calls and configured returns after each test"""
+        yield
+        for mock in vars(agent_patches).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+    
+    def test_analyze_resume_with_cache_hit(self, agent_patches, service, mock_db, mock_resume, make_analysis):
         """Test analysis returns cached result"""
         # Setup mocks
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
+        _stub_first(mock_db, mock_resume)
         
-        mock_cached = Mock(spec=ResumeAnalysis)
-        mock_cached.id = 1
-        mock_cached.resume_id = 1
-        mock_cached.analysis_data = {'cached': True}
-        mock_cached.agent_reasoning = []
-        mock_cached.has_reasoning = False
-        mock_cached.execution_time_ms = 0
-        mock_cached.status = 'success'
-        mock_cached.created_at = datetime.utcnow() - timedelta(days=5)
+        mock_cached = make_analysis(
+            analysis_data={'cached': True},
+            created_at=datetime.utcnow() - timedelta(days=5)
+        )
         
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = mock_cached
+        _stub_order_first(mock_db, mock_cached)
         
         result = service.analyze_resume(1, 1)
         
@@ -279,19 +311,16 @@ class TestFullAnalysisFlow:
         assert result['analysis_data'] == {'cached': True}
         
         # Agent should not be called
-        mock_agent_class.assert_not_called()
+        agent_patches.agent.assert_not_called()
     
-    @patch('app.services.agents.resume_agent_service.ResumeIntelligenceAgent')
-    @patch('app.services.agents.resume_agent_service.AgentExecutor')
-    @patch('app.services.agents.resume_agent_service.ResumeAnalysis')
-    def test_analyze_resume_with_cache_miss(self, mock_analysis_class, mock_executor_class, mock_agent_class, service, mock_db, mock_resume):
+    def test_analyze_resume_with_cache_miss(self, agent_patches, service, mock_db, mock_resume, make_analysis):
         """Test analysis executes agent on cache miss"""
         # Setup mocks
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_resume
-        mock_db.query.return_value.filter.return_value.order_by.return_value.first.return_value = None
+        _stub_first(mock_db, mock_resume)
+        _stub_order_first(mock_db, None)
         
         mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
+        agent_patches.agent.return_value = mock_agent
         
         mock_executor = Mock()
         mock_executor.execute_with_fallback.return_value = {
@@ -300,25 +329,18 @@ class TestFullAnalysisFlow:
             'execution_time_ms': 15000,
             'status': 'success'
         }
-        mock_executor_class.return_value = mock_executor
-        
-        mock_stored_analysis = Mock(spec=ResumeAnalysis)
-        mock_stored_analysis.id = 1
-        mock_stored_analysis.resume_id = 1
-        mock_stored_analysis.analysis_data = {}
-        mock_stored_analysis.agent_reasoning = []
-        mock_stored_analysis.has_reasoning = False
-        mock_stored_analysis.execution_time_ms = 15000
-        mock_stored_analysis.status = 'success'
-        mock_stored_analysis.created_at = datetime.utcnow()
-        
-        mock_analysis_class.return_value = mock_stored_analysis
+        agent_patches.executor.return_value = mock_executor
+        
+        mock_stored_analysis = make_analysis(execution_time_ms=15000, created_at=datetime.utcnow())
+        
         mock_db.add = Mock()
         mock_db.commit = Mock()
         mock_db.refresh = Mock()
         
-        result = service.analyze_resume(1, 1, force_refresh=True)
+        # ResumeAnalysis stays real for the cache-hit test's column filters
+        with patch('app.services.agents.resume_agent_service.ResumeAnalysis', return_value=mock_stored_analysis):
+            result = service.analyze_resume(1, 1, force_refresh=True)
         
         # Agent should be called
-        mock_agent_class.assert_called_once()
-        mock_executor_class.assert_called_once()
+        agent_patches.agent.assert_called_once()
+        agent_patches.executor.assert_called_once()
@@ -10,14 +10,24 @@ from fastapi import status
 
 from app.models.user import User
 
+# Keep this module's shared fixtures on one worker under `pytest -n auto`
+pytestmark = pytest.mark.xdist_group("resume_analysis")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_service():
-    """Mock resume agent service"""
+    """Mock resume agent service, patched once for the whole module"""
     with patch('app.routes.resume_analysis.ResumeAgentService') as mock:
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_service(mock_service):
+    """Clear the configured service instance and side effects after each test"""
+    yield
+    mock_service.reset_mock(return_value=True, side_effect=True)
+
+
 class TestAnalyzeResumeEndpoint:
     """Test POST /api/v1/resume-analysis/{resume_id}"""
     
@@ -87,45 +97,25 @@ class TestAnalyzeResumeEndpoint:
         call_kwargs = mock_service_instance.analyze_resume.call_args[1]
         assert call_kwargs['force_refresh'] is True
     
-    def test_analyze_resume_not_found(self, client, auth_headers, mock_service):
-        """Test analysis of nonexistent resume"""
+    @pytest.mark.parametrize("resume_id,error", [
+        (999, "Resume 999 not found"),
+        (1, "Resume not ready"),
+    ])
+    def test_analyze_resume_invalid_resume(self, client, auth_headers, mock_service, resume_id, error):
+        """Test analysis of a nonexistent or not-ready resume"""
         mock_service_instance = Mock()
         mock_service.return_value = mock_service_instance
         
-        mock_service_instance.analyze_resume.side_effect = ValueError("Resume 999 not found")
+        mock_service_instance.analyze_resume.side_effect = ValueError(error)
         
         response = client.post(
-            "/api/v1/resume-analysis/999",
+            f"/api/v1/resume-analysis/{resume_id}",
             json={'target_role': 'Software Engineer'},
             headers=auth_headers
         )
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
-    def test_analyze_resume_not_ready(self, client, auth_headers, mock_service):
-        """Test analysis of resume not ready"""
-        mock_service_instance = Mock()
-        mock_service.return_value = mock_service_instance
-        
-        mock_service_instance.analyze_resume.side_effect = ValueError("Resume not ready")
-        
-        response = client.post(
-            "/api/v1/resume-analysis/1",
-            json={'target_role': 'Software Engineer'},
-            headers=auth_headers
-        )
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-    
-    def test_analyze_resume_unauthorized(self, client):
-        """Test analysis without authentication"""
-        response = client.post(
-            "/api/v1/resume-analysis/1",
-            json={'target_role': 'Software Engineer'}
-        )
-        
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    
     def test_analyze_resume_default_target_role(self, client, auth_headers, mock_service):
         """Test analysis uses default target role"""
         mock_service_instance = Mock()
@@ -218,12 +208,6 @@ class TestGetResumeAnalysisEndpoint:
         )
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
-    
-    def test_get_analysis_unauthorized(self, client):
-        """Test getting analysis without authentication"""
-        response = client.get("/api/v1/resume-analysis/1")
-        
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
 class TestGetAnalysisHistoryEndpoint:
@@ -318,9 +302,18 @@ class TestGetAnalysisHistoryEndpoint:
         )
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestResumeAnalysisAuth:
+    """Test every resume analysis endpoint requires authentication"""
     
-    def test_get_history_unauthorized(self, client):
-        """Test getting history without authentication"""
-        response = client.get("/api/v1/resume-analysis/1/history")
+    @pytest.mark.parametrize("method,url,payload", [
+        ("post", "/api/v1/resume-analysis/1", {'target_role': 'Software Engineer'}),
+        ("get", "/api/v1/resume-analysis/1", None),
+        ("get", "/api/v1/resume-analysis/1/history", None),
+    ])
+    def test_unauthorized(self, client, method, url, payload):
+        """Test request without authentication is rejected"""
+        response = client.request(method, url, json=payload)
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
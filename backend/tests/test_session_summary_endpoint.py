@@ -4,58 +4,93 @@ Tests for Session Summary Endpoint
 Requirements: 19.1-19.12
 """
 import pytest
+from typing import Any, Dict, List
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from app.main import app
 from app.models.user import User
 from app.models.interview_session import InterviewSession, SessionStatus
 from app.models.question import Question
 from app.models.session_question import SessionQuestion
 from app.models.answer import Answer
 from app.models.evaluation import Evaluation
-from app.database import get_db
 
 
-@pytest.fixture
-def client(db: Session):
-    """Create test client with database override"""
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+@pytest.fixture(scope="module")
+def auth_headers(module_user: User):
+    """Sign one access token for the module's shared user"""
+    from app.utils.jwt import create_access_token
     
-    app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+    token = create_access_token(module_user.id, module_user.email)
+    return {"Authorization": f"Bearer {token}"}, module_user
 
 
-@pytest.fixture
-def auth_headers(db: Session):
-    """Create authenticated user and return auth headers"""
-    import uuid
-    from app.utils.jwt import create_access_token
+def _seed_completed_session(db: Session, user: User, evaluations: List[Dict[str, Any]]) -> InterviewSession:
+    """
+    Insert a completed session for ``user`` with one answered question per
+    entry in ``evaluations``.
     
-    user = User(
-        email=f"test-{uuid.uuid4()}@example.com",
-        password_hash="hashed",
-        name="Test User",
-        target_role="Software Engineer"
+    Only the session is an ORM object (tests read its id); the child rows
+    go in as multi-row Core INSERTs, committed once.
+    """
+    session = InterviewSession(
+        user_id=user.id,
+        role="Software Engineer",
+        difficulty="Medium",
+        status=SessionStatus.COMPLETED,
+        question_count=len(evaluations)
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.add(session)
+    db.flush()
     
-    token = create_access_token(user.id, user.email)
-    return {"Authorization": f"Bearer {token}"}, user
+    indexes = range(1, len(evaluations) + 1)
+    question_ids = db.scalars(
+        insert(Question.__table__).returning(Question.__table__.c.id, sort_by_parameter_order=True),
+        [
+            {
+                "question_text": f"Question {idx}",
+                "category": "Technical",
+                "difficulty": "Medium",
+                "role": "Software Engineer",
+                "expected_answer_points": ["Point 1", "Point 2", "Point 3"],
+                "time_limit_seconds": 300
+            }
+            for idx in indexes
+        ]
+    ).all()
+    db.execute(
+        insert(SessionQuestion.__table__),
+        [
+            {"session_id": session.id, "question_id": question_id, "display_order": idx, "status": "answered"}
+            for idx, question_id in zip(indexes, question_ids)
+        ]
+    )
+    answer_ids = db.scalars(
+        insert(Answer.__table__).returning(Answer.__table__.c.id, sort_by_parameter_order=True),
+        [
+            {
+                "session_id": session.id,
+                "question_id": question_id,
+                "user_id": user.id,
+                "answer_text": f"Answer {idx}",
+                "time_taken": 300
+            }
+            for idx, question_id in zip(indexes, question_ids)
+        ]
+    ).all()
+    db.execute(
+        insert(Evaluation.__table__),
+        [{"answer_id": answer_id, **scores} for answer_id, scores in zip(answer_ids, evaluations)]
+    )
+    db.commit()
+    return session
 
 
 class TestSessionSummaryEndpoint:
     """Test session summary endpoint"""
     
-    def test_get_session_summary_success(self, client, db: Session, auth_headers):
+    def test_get_session_summary_success(self, client: TestClient, db: Session, auth_headers):
         """
         Test successful session summary retrieval.
         
@@ -64,64 +99,18 @@ class TestSessionSummaryEndpoint:
         """
         headers, user = auth_headers
         
-        # Create completed session
-        session = InterviewSession(
-            user_id=user.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.COMPLETED,
-            question_count=2
+        # Create completed session with two evaluated answers
+        scores = dict(
+            content_quality=80.0,
+            clarity=75.0,
+            confidence=82.0,
+            technical_accuracy=77.0,
+            overall_score=78.5,
+            strengths=["Clear", "Detailed"],
+            improvements=["More examples", "Better structure"],
+            suggestions=["Practice", "Review"]
         )
-        db.add(session)
-        db.flush()
-        
-        # Create questions and evaluations
-        for i in range(2):
-            question = Question(
-                question_text=f"Question {i+1}",
-                category="Technical",
-                difficulty="Medium",
-                role="Software Engineer",
-                expected_answer_points=["Point 1", "Point 2", "Point 3"],
-                time_limit_seconds=300
-            )
-            db.add(question)
-            db.flush()
-            
-            sq = SessionQuestion(
-                session_id=session.id,
-                question_id=question.id,
-                display_order=i+1,
-                status="answered"
-            )
-            db.add(sq)
-            db.flush()
-            
-            answer = Answer(
-                session_id=session.id,
-                question_id=question.id,
-                user_id=user.id,
-                answer_text=f"Answer {i+1}",
-                time_taken=300
-            )
-            db.add(answer)
-            db.flush()
-            
-            evaluation = Evaluation(
-                answer_id=answer.id,
-                content_quality=80.0,
-                clarity=75.0,
-                confidence=82.0,
-                technical_accuracy=77.0,
-                overall_score=78.5,
-                strengths=["Clear", "Detailed"],
-                improvements=["More examples", "Better structure"],
-                suggestions=["Practice", "Review"]
-            )
-            db.add(evaluation)
-            db.flush()
-        
-        db.commit()
+        session = _seed_completed_session(db, user, [scores, scores])
         
         # Get summary
         response = client.get(
@@ -151,7 +140,7 @@ class TestSessionSummaryEndpoint:
         assert 'radar_chart_data' in data
         assert 'line_chart_data' in data
     
-    def test_get_session_summary_not_found(self, client, auth_headers):
+    def test_get_session_summary_not_found(self, client: TestClient, auth_headers):
         """
         Test summary retrieval for non-existent session.
         
@@ -168,7 +157,7 @@ class TestSessionSummaryEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()['detail'].lower()
     
-    def test_get_session_summary_not_completed(self, client, db: Session, auth_headers):
+    def test_get_session_summary_not_completed(self, client: TestClient, db: Session, auth_headers):
         """
         Test summary retrieval for incomplete session.
         
@@ -196,7 +185,7 @@ class TestSessionSummaryEndpoint:
         assert response.status_code == 400
         assert "not completed" in response.json()['detail'].lower()
     
-    def test_get_session_summary_unauthorized(self, client, db: Session, auth_headers):
+    def test_get_session_summary_unauthorized(self, client: TestClient, db: Session, auth_headers):
         """
         Test summary retrieval for session owned by another user.
         
@@ -234,7 +223,7 @@ class TestSessionSummaryEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()['detail'].lower()
     
-    def test_get_session_summary_no_auth(self, client, db: Session):
+    def test_get_session_summary_no_auth(self, client: TestClient, db: Session):
         """
         Test summary retrieval without authentication.
         
@@ -245,7 +234,7 @@ class TestSessionSummaryEndpoint:
         
         assert response.status_code in [401, 403]  # Either is acceptable for no auth
     
-    def test_get_session_summary_with_visualization_data(self, client, db: Session, auth_headers):
+    def test_get_session_summary_with_visualization_data(self, client: TestClient, db: Session, auth_headers):
         """
         Test that summary includes visualization data.
         
@@ -254,50 +243,8 @@ class TestSessionSummaryEndpoint:
         """
         headers, user = auth_headers
         
-        # Create completed session
-        session = InterviewSession(
-            user_id=user.id,
-            role="Software Engineer",
-            difficulty="Medium",
-            status=SessionStatus.COMPLETED,
-            question_count=1
-        )
-        db.add(session)
-        db.flush()
-        
-        # Create question and evaluation
-        question = Question(
-            question_text="Test question",
-            category="Technical",
-            difficulty="Medium",
-            role="Software Engineer",
-            expected_answer_points=["Point 1", "Point 2", "Point 3"],
-            time_limit_seconds=300
-        )
-        db.add(question)
-        db.flush()
-        
-        sq = SessionQuestion(
-            session_id=session.id,
-            question_id=question.id,
-            display_order=1,
-            status="answered"
-        )
-        db.add(sq)
-        db.flush()
-        
-        answer = Answer(
-            session_id=session.id,
-            question_id=question.id,
-            user_id=user.id,
-            answer_text="Test answer",
-            time_taken=300
-        )
-        db.add(answer)
-        db.flush()
-        
-        evaluation = Evaluation(
-            answer_id=answer.id,
+        # Create completed session with one evaluated answer
+        session = _seed_completed_session(db, user, [dict(
             content_quality=85.0,
             clarity=80.0,
             confidence=90.0,
@@ -306,11 +253,7 @@ class TestSessionSummaryEndpoint:
             strengths=["Excellent"],
             improvements=["Minor tweaks"],
             suggestions=["Keep it up"]
-        )
-        db.add(evaluation)
-        db.flush()
-        
-        db.commit()
+        )])
         
         # Get summary
         response = client.get(
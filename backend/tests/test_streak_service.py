@@ -36,7 +36,7 @@ class TestStreakService:
         
         # Set last practice to 20 hours ago
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-        test_user.current_streak = "1"
+        test_user.current_streak = 1
         db.commit()
         
         # Second practice within 24 hours
@@ -51,7 +51,7 @@ class TestStreakService:
         
         # Set up user with streak of 5, last practice 30 hours ago
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=30)
-        test_user.current_streak = "5"
+        test_user.current_streak = 5
         db.commit()
         
         # Practice after 24 hours (grace period)
@@ -66,7 +66,7 @@ class TestStreakService:
         
         # Set up user with streak of 10, last practice 50 hours ago
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=50)
-        test_user.current_streak = "10"
+        test_user.current_streak = 10
         db.commit()
         
         # Practice after 48 hours (streak broken)
@@ -82,7 +82,7 @@ class TestStreakService:
         # Build up a streak
         for i in range(5):
             test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-            test_user.current_streak = str(i)
+            test_user.current_streak = i
             db.commit()
             service.update_streak(test_user.id)
         
@@ -95,7 +95,7 @@ class TestStreakService:
         
         # Set up user with 6-day streak
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-        test_user.current_streak = "6"
+        test_user.current_streak = 6
         db.commit()
         
         # Practice to reach 7 days
@@ -117,7 +117,7 @@ class TestStreakService:
         
         # Set up user with 29-day streak
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-        test_user.current_streak = "29"
+        test_user.current_streak = 29
         db.commit()
         
         # Practice to reach 30 days
@@ -141,7 +141,7 @@ class TestStreakService:
         for i in range(3):
             if i > 0:
                 test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-                test_user.current_streak = str(i)
+                test_user.current_streak = i
                 db.commit()
             service.update_streak(test_user.id)
         
@@ -157,8 +157,8 @@ class TestStreakService:
         
         # Set up user with active streak
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=10)
-        test_user.current_streak = "5"
-        test_user.longest_streak = "10"
+        test_user.current_streak = 5
+        test_user.longest_streak = 10
         db.commit()
         
         result = service.get_current_streak(test_user.id)
@@ -193,8 +193,8 @@ class TestStreakService:
         
         # Set up user with history
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=10)
-        test_user.current_streak = "5"
-        test_user.longest_streak = "10"
+        test_user.current_streak = 5
+        test_user.longest_streak = 10
         test_user.streak_history = [
             {'date': '2026-02-10T10:00:00', 'streak_count': 1},
             {'date': '2026-02-11T10:00:00', 'streak_count': 2},
@@ -219,7 +219,7 @@ class TestStreakService:
         
         # Set up user with existing streak
         test_user.last_practice_date = datetime.utcnow() - timedelta(hours=20)
-        test_user.current_streak = "5"
+        test_user.current_streak = 5
         db.commit()
         
         start_time = time.time()